@@ -0,0 +1,107 @@
+from typing import Literal
+
+import bpy
+import numpy as np
+
+
+class LIPSYNC2D_KeyframeWriter:
+    """
+    Writes buffered keyframes into F-Curves in bulk.
+
+    Inserting keyframes one by one through ``keyframe_points.insert`` reallocates the
+    keyframe array and recomputes handles on every call. This helper instead allocates
+    all points at once with ``keyframe_points.add`` and fills them through
+    ``foreach_set``, which is a single C-level copy per F-Curve.
+    """
+
+    @staticmethod
+    def get_interpolation_value(
+        interpolation: Literal["CONSTANT", "LINEAR", "BEZIER"],
+    ) -> int:
+        """
+        Get the integer value Blender uses internally for an interpolation enum item.
+
+        :param interpolation: Interpolation enum identifier.
+        :return: Enum value expected by ``foreach_set("interpolation", ...)``.
+        :rtype: int
+        """
+        return (
+            bpy.types.Keyframe.bl_rna.properties["interpolation"]
+            .enum_items[interpolation]
+            .value
+        )
+
+    @staticmethod
+    def write(
+        fcurve: bpy.types.FCurve,
+        keyframes: dict[float, float],
+        interpolation: Literal["CONSTANT", "LINEAR", "BEZIER"],
+    ) -> int:
+        """
+        Write buffered keyframes into an F-Curve.
+
+        Keyframes are given as a ``{frame: value}`` mapping, so a later write on the same
+        frame replaces the previous one, exactly like ``keyframe_points.insert`` does.
+        When the F-Curve already holds keyframes, points are inserted one by one to keep
+        existing keyframes, then the interpolation of the whole curve is set at once.
+
+        :param fcurve: The F-Curve receiving the keyframes.
+        :param keyframes: Mapping of frame to value.
+        :param interpolation: Interpolation applied to the written keyframes.
+        :return: Number of keyframes written.
+        :rtype: int
+        """
+        if not keyframes:
+            return 0
+
+        keyframe_points = fcurve.keyframe_points
+
+        if len(keyframe_points) > 0:
+            for frame, value in keyframes.items():
+                keyframe_points.insert(frame, value=value, options={"FAST"})
+            # Inserted points get Blender's default interpolation, set_interpolation also updates the curve
+            LIPSYNC2D_KeyframeWriter.set_interpolation(fcurve, interpolation)
+            return len(keyframes)
+
+        frames = sorted(keyframes)
+        count = len(frames)
+
+        co = np.empty(count * 2, dtype=np.float32)
+        co[0::2] = frames
+        co[1::2] = [keyframes[frame] for frame in frames]
+
+        keyframe_points.add(count)
+        keyframe_points.foreach_set("co", co)
+        keyframe_points.foreach_set(
+            "interpolation",
+            np.full(
+                count,
+                LIPSYNC2D_KeyframeWriter.get_interpolation_value(interpolation),
+                dtype=np.int32,
+            ),
+        )
+        fcurve.update()
+
+        return count
+
+    @staticmethod
+    def set_interpolation(
+        fcurve: bpy.types.FCurve,
+        interpolation: Literal["CONSTANT", "LINEAR", "BEZIER"],
+    ) -> None:
+        """
+        Set the interpolation of every keyframe of an F-Curve in a single write.
+
+        :param fcurve: The F-Curve whose keyframes are updated.
+        :param interpolation: Interpolation applied to all keyframes.
+        """
+        keyframe_points = fcurve.keyframe_points
+        keyframe_points.foreach_set(
+            "interpolation",
+            np.full(
+                len(keyframe_points),
+                LIPSYNC2D_KeyframeWriter.get_interpolation_value(interpolation),
+                dtype=np.int32,
+            ),
+        )
+        fcurve.update()
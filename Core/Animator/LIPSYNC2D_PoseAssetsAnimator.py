@@ -1,24 +1,22 @@
-from typing import Iterator, Literal, cast
+import re
+from typing import cast
 
 import bpy
+import numpy as np
 
-from .LIPSYNC2D_ShapeKeysAnimator import LIPSYNC2D_ShapeKeysAnimator
-
-
+from .LIPSYNC2D_KeyframeWriter import LIPSYNC2D_KeyframeWriter
+from .kernels import compute_keep_mask, corrected_end_frame, viseme_frames
 from ..phoneme_to_viseme import (
     get_viseme_priority,
-    viseme_items_mpeg4_v2,
-    UNSKIPPABLE_VISEMES,
+    UNSKIPPABLE_MASK,
+    VISEME_IDS,
+    VISEMES,
 )
 
 from ..Timeline.LIPSYNC2D_TimeConversion import LIPSYNC2D_TimeConversion
 from ..constants import ACTION_SUFFIX_NAME, SLOT_POSE_ASSETS_NAME
 from ..Timeline.LIPSYNC2D_Timeline import LIPSYNC2D_Timeline
-from ..types import (
-    VisemeActionAnimationData,
-    VisemeData,
-    WordTiming,
-)
+from ..types import VisemeData, WordTiming
 from ...Preferences.LIPSYNC2D_AP_Preferences import LIPSYNC2D_AP_Preferences
 from ...lipsync_types import (
     BpyAction,
@@ -30,6 +28,8 @@ from ...lipsync_types import (
     BpyPropertyGroup,
 )
 
+BONE_NAME_PATTERN = re.compile(r'pose\.bones\["([^"]+)"\]')
+
 
 class LIPSYNC2D_PoseAssetsAnimator:
     """
@@ -61,6 +61,14 @@ class LIPSYNC2D_PoseAssetsAnimator:
         self.close_motion_duration = -1
         self.channelbag: BpyActionChannelbag
         self.armature: BpyObject | None = None
+        self._pending_frames: list[int] = []
+        self._pending_viseme_ids: list[int] = []
+        self._pose_values: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self._has_pose_values: list[bool] = []
+        self._viseme_poses: dict[str, BpyAction | None] = {}
+        self._viseme_priorities: list[int] = []
+        self._viseme_pose_ids: list[int] = []
+        self._pose_scans: dict[int, list[tuple[str, int, float]]] = {}
 
     def get_armature_action(self, obj: BpyObject):
         """
@@ -93,6 +101,10 @@ class LIPSYNC2D_PoseAssetsAnimator:
         the provided object, ensuring the removal of existing animation
         data within the specified context.
 
+        When Clear Keyframes is enabled, the F-Curves themselves are removed in a single
+        call instead of being emptied one by one. `setup_fcurves` must then be called
+        to create the channels again before inserting keyframes.
+
         :param obj: The Blender armature object from which previous keyframes are to be
             cleared. Must have an armature data type.
         :type obj: BpyObject
@@ -110,8 +122,13 @@ class LIPSYNC2D_PoseAssetsAnimator:
         strip = cast(BpyActionKeyframeStrip, action.layers[0].strips[0])
         channelbag = strip.channelbag(self._slot, ensure=True)
 
+        if obj.lipsync2d_props.lip_sync_2d_use_clear_keyframes:  # type: ignore
+            channelbag.fcurves.clear()
+            return
+
         for fcurve in channelbag.fcurves:
-            fcurve.keyframe_points.clear()
+            if len(fcurve.keyframe_points) > 0:
+                fcurve.keyframe_points.clear()
 
     def insert_keyframes(
         self,
@@ -146,52 +163,72 @@ class LIPSYNC2D_PoseAssetsAnimator:
         self.is_last_word = is_last_word
         self.is_first_word = word_index == 0
 
+        # A word without visemes has nothing to key, only first and last words still need their silences
+        if visemes_data["visemes_len"] == 0 and not self.is_first_word and not self.is_last_word:
+            return
+
         # Insert silences before or after word when needed
         self.insert_silences(visemes_data, word_index)
 
-        # Iterate through visemes and insert keyframes on time
-        for action_anim_data in self._insert_on_visemes(
+        # Queue the visemes kept by the skip logic, as a whole word
+        frames, viseme_ids = self._insert_on_visemes(
             obj, props, visemes_data, word_timing
-        ):
-            if (action := action_anim_data["action"]) is None:
-                continue
-
-            self.insert_keyframe_points(action, action_anim_data["frame"])
+        )
+        self._pending_frames.extend(frames)
+        self._pending_viseme_ids.extend(viseme_ids)
 
     def insert_keyframe_points(
         self,
-        pose_action: BpyAction,
+        viseme: str,
         frame: int,
-        interpolation: Literal["LINEAR"] = "LINEAR",
     ):
         """
-        Inserts keyframe points from a pose asset action into the target armature action.
+        Queue the pose asset keyframes of a viseme for insertion at the given frame.
 
-        This method copies bone transform values from the pose asset's F-curves and inserts
-        them as keyframes at the specified frame in the target armature's action.
+        Keyframes are only buffered here. They are written into the target armature action
+        in one pass by `flush_keyframes`, once every word has been processed.
 
-        :param pose_action: The pose asset action containing the bone poses to copy.
-        :type pose_action: BpyAction
+        :param viseme: The viseme whose pose asset should be keyed.
+        :type viseme: str
         :param frame: The frame number where keyframes should be inserted.
         :type frame: int
-        :param interpolation: The interpolation type for the keyframes.
-        :type interpolation: Literal["LINEAR"]
         """
-        for fcurve in self.channelbag.fcurves:
-            pose_asset_fcurve = pose_action.fcurves.find(
-                fcurve.data_path, index=fcurve.array_index
-            )
-            if pose_asset_fcurve is None:
-                continue
-
-            # Since Action is from a Pose Asset, we can safely assume that first keyframe point holds the Pose
-            fcurve_value = pose_asset_fcurve.keyframe_points[0].co.y
-            kframe = fcurve.keyframe_points.insert(
-                frame,
-                value=fcurve_value,
+        viseme_id = VISEME_IDS[viseme]
+        if not self._has_pose_values[viseme_id]:
+            return
+
+        self._pending_frames.append(frame)
+        self._pending_viseme_ids.append(viseme_id)
+
+    def flush_keyframes(self, obj: BpyObject):
+        """
+        Write all queued pose asset keyframes into the target armature action.
+
+        Each F-Curve of the target channelbag receives all of its keyframes in a single
+        bulk write. Values come from the lookup table built by `setup_pose_values`.
+
+        :param obj: The Blender armature object being animated.
+        :type obj: BpyObject
+        """
+        if not self._pending_frames:
+            return
+
+        frames = np.array(self._pending_frames, dtype=np.float32)
+        # One row per queued keyframe, one column per F-Curve of the channelbag
+        values = self._pose_values[np.array(self._pending_viseme_ids, dtype=np.intp)]
+
+        for index, fcurve in enumerate(self.channelbag.fcurves):
+            column = values[:, index]
+            is_posed = ~np.isnan(column)
+
+            keyframes = dict(zip(frames[is_posed].tolist(), column[is_posed].tolist()))
+
+            self.inserted_keyframes += LIPSYNC2D_KeyframeWriter.write(
+                fcurve, keyframes, "LINEAR"
             )
-            kframe.interpolation = interpolation
-            self.inserted_keyframes += 1
+
+        self._pending_frames.clear()
+        self._pending_viseme_ids.clear()
 
     def insert_silences(self, visemes_data: VisemeData, word_index: int):
         """
@@ -205,59 +242,49 @@ class LIPSYNC2D_PoseAssetsAnimator:
         :param word_index: The index of the current word being processed.
         :type word_index: int
         """
-        add_sil_at_word_end = (
-            self.delay_until_next_word > self.silence_frame_threshold
-        ) or self.is_last_word
-        action: BpyAction | None = getattr(self.props, f"lip_sync_2d_viseme_pose_sil")
-
-        if action is None:
+        if self._viseme_poses["sil"] is None:
             return
 
-        if add_sil_at_word_end:
+        delay_until_next_word = self.delay_until_next_word
+        in_between_frame_threshold = self.in_between_frame_threshold
+        close_motion_duration = self.close_motion_duration
 
-            # Last viseme is inserted a bit before end of word. This ensures that silence uses correct timing
-            corrected_word_end_frame = (
-                LIPSYNC2D_ShapeKeysAnimator.get_corrected_end_frame(
-                    self.word_start_frame, visemes_data
-                )
-            )
+        # Last viseme is inserted a bit before end of word. This ensures that silence uses correct timing
+        corrected_word_end_frame = corrected_end_frame(
+            self.word_start_frame,
+            visemes_data["visemes_parts"],
+            visemes_data["visemes_len"],
+        )
+
+        if self.is_last_word:
+            frame = corrected_word_end_frame + close_motion_duration
+            self.insert_keyframe_points("sil", int(frame))
+
+        elif delay_until_next_word > self.silence_frame_threshold:
+            # Add silence after current word, with some delay to allow a smooth motion
+            # If close_motion_duration is too high, fallback to next word time-postion minus defined threshold
             frame = corrected_word_end_frame + max(
                 1,
                 min(
-                    self.delay_until_next_word - self.in_between_frame_threshold,
-                    self.close_motion_duration,
+                    delay_until_next_word - in_between_frame_threshold,
+                    close_motion_duration,
                 ),
             )
+            self.insert_keyframe_points("sil", int(frame))
 
-            if not self.is_last_word:
-                # Add silence after current word, with some delay to allow a smooth motion
-                # If close_motion_duration is too high, fallback to next word time-postion minus defined threshold
-                frame = corrected_word_end_frame + max(
-                    1,
-                    min(
-                        self.delay_until_next_word - self.in_between_frame_threshold,
-                        self.close_motion_duration,
-                    ),
-                )
-                self.insert_keyframe_points(action, int(frame))
-
-                frame = (
-                    corrected_word_end_frame
-                    + self.delay_until_next_word
-                    - max(1, self.in_between_frame_threshold)
-                )
-                self.insert_keyframe_points(action, int(frame))
-            else:
-                frame = corrected_word_end_frame + self.close_motion_duration
-                self.insert_keyframe_points(action, int(frame))
+            frame = (
+                corrected_word_end_frame
+                + delay_until_next_word
+                - max(1, in_between_frame_threshold)
+            )
+            self.insert_keyframe_points("sil", int(frame))
 
         if self.is_first_word:
-
             frame = max(
                 LIPSYNC2D_Timeline.get_frame_start(),
-                self.word_start_frame - max(1, self.close_motion_duration / 2),
+                self.word_start_frame - max(1, close_motion_duration / 2),
             )
-            self.insert_keyframe_points(action, int(frame))
+            self.insert_keyframe_points("sil", int(frame))
 
     def _insert_on_visemes(
         self,
@@ -265,13 +292,13 @@ class LIPSYNC2D_PoseAssetsAnimator:
         props: BpyPropertyGroup,
         visemes_data: VisemeData,
         word_timing: WordTiming,
-    ) -> Iterator[VisemeActionAnimationData]:
+    ) -> tuple[list[int], list[int]]:
         """
-        Generate viseme animation data for inserting pose asset keyframes based on viseme timing.
+        Compute which visemes of a word should be keyed with their pose asset, and when.
 
-        This function processes viseme data and yields animation information for each viseme,
-        ensuring that pose assets for lip-sync animations are applied correctly for smooth transitions
-        between bone pose states. It also handles timing and redundancy checks.
+        The whole word goes through the skip logic at once (timing, priority and redundancy
+        checks). Results are returned as two parallel lists rather than one record per viseme,
+        so they can be appended to the pending buffers as-is.
 
         :param obj: The Blender armature object to insert visemes into.
         :type obj: BpyObject
@@ -281,108 +308,51 @@ class LIPSYNC2D_PoseAssetsAnimator:
         :type visemes_data: VisemeData
         :param word_timing: Timing information for the word's animation frames.
         :type word_timing: WordTiming
-        :yield: Animation data for each viseme including frame, action, and metadata.
-        :rtype: Iterator[VisemeActionAnimationData]
+        :return: Frame and viseme id of each viseme to key.
+        :rtype: tuple[list[int], list[int]]
         """
 
         if not isinstance(obj.data, bpy.types.Armature):
-            yield {
-                "frame": -1,
-                "viseme": "",
-                "action": None,
-                "action_name": "",
-                "viseme_index": -1,
-            }
-
-        visemes = enumerate(visemes_data["visemes"])
-
-        for viseme_index, v in visemes:
-            self.is_last_viseme = (viseme_index + 1) == visemes_data["visemes_len"]
-            viseme_frame_start = word_timing["word_frame_start"] + round(
-                viseme_index * visemes_data["visemes_parts"]
-            )
-
-            if v not in self.pose_assets_actions:
-                continue
-
-            if self.should_skip_keyframe(props, v, viseme_frame_start):
-                continue
-
-            action_name: str = getattr(props, f"lip_sync_2d_viseme_pose_{v}")
-            action = self.pose_assets_actions[v]
-
-            yield {
-                "frame": viseme_frame_start,
-                "viseme": v,
-                "action": action,
-                "viseme_index": viseme_index,
-                "action_name": action_name,
-            }
-
-            self.previous_start = viseme_frame_start
-            self.previous_viseme = v
-
-    def should_skip_keyframe(self, props, v, viseme_frame_start):
-        # Skip if there's a priority conflict
-        if self.should_skip_due_to_priority_conflict(v, viseme_frame_start):
-            return True
-
-        # Skip if redundant with previous viseme
-        if self.is_redundant(props, v):
-            return True
+            return [], []
 
-        # Handle timing conflicts
-        if self.is_prev_kframe_too_close(viseme_frame_start):
-            return self._should_skip_due_to_timing(props, v)
+        visemes = visemes_data["visemes"]
+        has_pose_values = self._has_pose_values
 
-        return False
-
-    def _should_skip_due_to_timing(self, props, v: str) -> bool:
-        """Handle timing conflicts based on force_lips_contact setting"""
-        force_lips_contact = props.lip_sync_2d_prioritize_accuracy
-        is_unskippable = v.lower() in UNSKIPPABLE_VISEMES
-
-        if force_lips_contact:
-            # With force enabled: only skip skippable visemes
-            return not is_unskippable
-        else:
-            # Without force: skip all visemes that are too close
-            return True
-
-    def should_skip_due_to_priority_conflict(
-        self, current_viseme: str, frame: int
-    ) -> bool:
-        """Skip current viseme if previous viseme at same frame has higher priority."""
-        if not self.has_already_a_kframe(frame) or not self.previous_viseme:
-            return False
-
-        prev_priority = get_viseme_priority(self.previous_viseme)
-        current_priority = get_viseme_priority(current_viseme)
-
-        # Skip if current has lower priority (higher number)
-        return current_priority > prev_priority
-
-    def has_already_a_kframe(self, viseme_frame_start):
-        """Check if a keyframe already exists at the specified frame."""
-        return viseme_frame_start == self.previous_start
+        frames = viseme_frames(
+            word_timing["word_frame_start"],
+            visemes_data["visemes_parts"],
+            visemes_data["visemes_len"],
+        )
 
-    def is_prev_kframe_too_close(self, viseme_frame_start):
-        """Check if the previous keyframe is too close to the current frame."""
-        return self.previous_start >= 0 and (
-            viseme_frame_start - self.previous_start <= self.in_between_frame_threshold
+        candidate_ids: list[int] = []
+        candidate_frames: list[int] = []
+        for v, frame in zip(visemes, frames):
+            viseme_id = VISEME_IDS.get(v, -1)
+            if viseme_id >= 0 and has_pose_values[viseme_id]:
+                candidate_ids.append(viseme_id)
+                candidate_frames.append(frame)
+
+        keep, previous_start, previous_id = compute_keep_mask(
+            candidate_ids,
+            candidate_frames,
+            self._viseme_priorities,
+            self._viseme_pose_ids,
+            UNSKIPPABLE_MASK,
+            VISEME_IDS["sil"],
+            self.in_between_frame_threshold,
+            props.lip_sync_2d_prioritize_accuracy,
+            self.previous_start,
+            VISEME_IDS.get(self.previous_viseme, -1),
         )
 
-    def is_redundant(self, props: BpyPropertyGroup, v: str):
-        """Check if the current viseme pose asset is the same as the previous one."""
-        if self.previous_viseme is None or self.previous_viseme == "sil":
-            return False
+        # Skip state is synced back once per word
+        self.previous_start = previous_start
+        self.previous_viseme = VISEMES[previous_id] if previous_id >= 0 else None
 
-        previous_viseme_prop_name = getattr(
-            props, f"lip_sync_2d_viseme_pose_{self.previous_viseme}"
-        )
-        viseme_prop_name = getattr(props, f"lip_sync_2d_viseme_pose_{v}")
+        kept_frames = [frame for frame, is_kept in zip(candidate_frames, keep) if is_kept]
+        kept_ids = [viseme_id for viseme_id, is_kept in zip(candidate_ids, keep) if is_kept]
 
-        return previous_viseme_prop_name == viseme_prop_name
+        return kept_frames, kept_ids
 
     def set_interpolation(self, obj: BpyObject):
         """Set interpolation type for pose asset keyframes (placeholder method)."""
@@ -435,9 +405,22 @@ class LIPSYNC2D_PoseAssetsAnimator:
         self.previous_start = -1
         self.previous_viseme = None
         self.inserted_keyframes = 0
+        self._pending_frames = []
+        self._pending_viseme_ids = []
+        self._has_pose_values = [False] * len(VISEMES)
         self.props = props
         self.armature = obj
 
+        self._viseme_poses = {
+            v: getattr(props, f"lip_sync_2d_viseme_pose_{v}") for v in VISEMES
+        }
+        # Lists below are indexed by viseme id, as expected by compute_keep_mask
+        self._viseme_priorities = [get_viseme_priority(v) for v in VISEMES]
+        self._viseme_pose_ids = [
+            pose.as_pointer() if pose is not None else 0
+            for pose in self._viseme_poses.values()
+        ]
+
     def setup_animation_properties(self, obj: BpyObject):
         """
         Set up animation-specific properties including actions and F-curves for pose assets.
@@ -462,13 +445,10 @@ class LIPSYNC2D_PoseAssetsAnimator:
         :return: Dictionary mapping viseme IDs to pose asset actions.
         :rtype: dict[str, BpyAction]
         """
-        visemes = viseme_items_mpeg4_v2(None, None)
-
         available_actions: dict[str, BpyAction] = {
-            enum_id: key
-            for (enum_id, _, _) in visemes
-            if (key := getattr(self.props, f"lip_sync_2d_viseme_pose_{enum_id}"))
-            is not None
+            enum_id: action
+            for enum_id, action in self._viseme_poses.items()
+            if action is not None
         }
 
         return available_actions
@@ -498,37 +478,36 @@ class LIPSYNC2D_PoseAssetsAnimator:
         if props.lip_sync_2d_use_clear_keyframes:
             fcurves.clear()
 
-        seen_actions = set()
-        bone_groups_cache = {}
+        # x/y/z/w channels share a data path, so the bone name is only extracted once per path
+        bone_names_cache: dict[str, str | None] = {}
+        existing_fcurves = {(fcurve.data_path, fcurve.array_index) for fcurve in fcurves}
+        wanted_fcurves: list[tuple[str, int, str | None]] = []
 
+        # Several visemes can share the same pose asset. Python wrappers of a same Action
+        # are distinct objects, so actions are deduplicated by their data pointer.
+        unique_actions: dict[int, BpyAction] = {}
         for action in self.pose_assets_actions.values():
-            action_id = id(action)
-            if action_id in seen_actions:
-                continue
-
-            seen_actions.add(action_id)
-
-            if (
-                len(action.layers) == 0
-                or len(action.layers[0].strips) == 0
-                or not isinstance(
-                    pose_strip := action.layers[0].strips[0],
-                    bpy.types.ActionKeyframeStrip,
-                )
-                or len(action.slots) == 0
-            ):
+            unique_actions.setdefault(action.as_pointer(), action)
+
+        # First pass: read every pose asset once, without touching the target action.
+        # Scans are kept and reused when building pose values.
+        self._pose_scans = {}
+        for action_id, action in unique_actions.items():
+            pose_scan = self._scan_pose_action(action)
+            if pose_scan is None:
                 continue  # Skip malformed pose asset actions
 
-            pose_channelbag = pose_strip.channelbag(action.slots[0])
+            self._pose_scans[action_id] = pose_scan
 
-            for fcurve in pose_channelbag.fcurves:
-                if fcurves.find(fcurve.data_path, index=fcurve.array_index):
+            for data_path, array_index, _ in pose_scan:
+                fcurve_key = (data_path, array_index)
+                if fcurve_key in existing_fcurves:
                     continue
 
-                property_name = fcurve.data_path.split(".")[-1]
+                property_name = data_path.split(".")[-1]
 
                 if is_basic_rig and (
-                    "bbone" in fcurve.data_path
+                    "bbone" in data_path
                     or property_name
                     not in {
                         "location",
@@ -539,17 +518,105 @@ class LIPSYNC2D_PoseAssetsAnimator:
                 ):
                     continue
 
-                new_fcurve = fcurves.new(fcurve.data_path, index=fcurve.array_index)
+                if data_path not in bone_names_cache:
+                    bone_match = BONE_NAME_PATTERN.search(data_path)
+                    bone_names_cache[data_path] = bone_match.group(1) if bone_match else None
+
+                existing_fcurves.add(fcurve_key)
+                wanted_fcurves.append((data_path, array_index, bone_names_cache[data_path]))
+
+        # Second pass: create each bone group once
+        groups = self.channelbag.groups
+        bone_groups_cache = {
+            bone_name: groups.get(bone_name) or groups.new(bone_name)
+            for bone_name in dict.fromkeys(
+                bone_name for (_, _, bone_name) in wanted_fcurves if bone_name is not None
+            )
+        }
+
+        # Third pass: create F-Curves and assign their group
+        for data_path, array_index, bone_name in wanted_fcurves:
+            new_fcurve = fcurves.new(data_path, index=array_index)
+
+            if bone_name is not None:
+                new_fcurve.group = bone_groups_cache[bone_name]
+
+        self.setup_pose_values()
+
+    @staticmethod
+    def _scan_pose_action(action: BpyAction) -> list[tuple[str, int, float]] | None:
+        """
+        Read the channels of a pose asset action along with their pose value.
+
+        This is a read-only walk over the pose asset, so every piece of data needed from it
+        is collected in a single pass.
+
+        :param action: The pose asset action to read.
+        :type action: BpyAction
+        :return: Data path, array index and pose value (NaN when unkeyed) of each F-Curve,
+            or None if the action is malformed.
+        :rtype: list[tuple[str, int, float]] | None
+        """
+        if (
+            len(action.layers) == 0
+            or len(action.layers[0].strips) == 0
+            or not isinstance(
+                pose_strip := action.layers[0].strips[0],
+                bpy.types.ActionKeyframeStrip,
+            )
+            or len(action.slots) == 0
+        ):
+            return None
+
+        pose_channelbag = pose_strip.channelbag(action.slots[0])
+        if pose_channelbag is None:
+            return None
+
+        # Since Action is from a Pose Asset, we can safely assume that first keyframe point holds the Pose
+        return [
+            (
+                fcurve.data_path,
+                fcurve.array_index,
+                fcurve.keyframe_points[0].co.y if len(fcurve.keyframe_points) else np.nan,
+            )
+            for fcurve in pose_channelbag.fcurves
+        ]
+
+    def setup_pose_values(self):
+        """
+        Build a lookup table of pose values for every viseme.
+
+        The table holds one row per viseme id and one column per F-Curve of the target
+        channelbag, with the value of each F-Curve in the viseme's pose asset. F-Curves
+        that the pose asset does not animate are set to NaN. Pose asset data comes from
+        the scans made by `setup_fcurves`.
+        """
+        fcurve_indices = {
+            (fcurve.data_path, fcurve.array_index): index
+            for index, fcurve in enumerate(self.channelbag.fcurves)
+        }
+        values_by_action: dict[int, np.ndarray] = {}
+        self._pose_values = np.full(
+            (len(VISEMES), len(fcurve_indices)), np.nan, dtype=np.float32
+        )
+        self._has_pose_values = [False] * len(VISEMES)
+
+        for viseme, action in self.pose_assets_actions.items():
+            action_id = action.as_pointer()
+
+            if action_id not in values_by_action:
+                values = np.full(len(fcurve_indices), np.nan, dtype=np.float32)
 
-                if "pose.bones[" in fcurve.data_path:
-                    bone_name = fcurve.data_path.split('"')[1]
+                for data_path, array_index, value in self._pose_scans.get(action_id, ()):
+                    index = fcurve_indices.get((data_path, array_index))
+                    if index is not None:
+                        values[index] = value
 
-                    if bone_name not in bone_groups_cache:
-                        bone_groups_cache[bone_name] = self.channelbag.groups.get(
-                            bone_name
-                        ) or self.channelbag.groups.new(bone_name)
+                values_by_action[action_id] = values
 
-                    new_fcurve.group = bone_groups_cache[bone_name]
+            viseme_id = VISEME_IDS[viseme]
+            self._pose_values[viseme_id] = values_by_action[action_id]
+            self._has_pose_values[viseme_id] = True
 
     def set_up_action(
         self, obj: BpyObject
@@ -587,9 +654,7 @@ class LIPSYNC2D_PoseAssetsAnimator:
             strip = cast(
                 bpy.types.ActionKeyframeStrip, layer.strips.new(type="KEYFRAME")
             )
-            self.armature.animation_data.action = action
         else:
-            self.armature.animation_data.action = action
             layer = action.layers[0]
             strip = cast(bpy.types.ActionKeyframeStrip, layer.strips[0])
 
@@ -597,8 +662,12 @@ class LIPSYNC2D_PoseAssetsAnimator:
             id_type="OBJECT", name=f"{SLOT_POSE_ASSETS_NAME}"
         )
 
-        self.armature.animation_data.action = action
-        self.armature.animation_data.action_slot = self._slot
+        # Assigning action or slot tags the depsgraph, so only write them when they change
+        anim_data = self.armature.animation_data
+        if anim_data.action != action:
+            anim_data.action = action
+        if anim_data.action_slot != self._slot:
+            anim_data.action_slot = self._slot
 
         return action, strip
 
@@ -606,14 +675,15 @@ class LIPSYNC2D_PoseAssetsAnimator:
         """Clean up resources after pose asset animation is complete."""
         pass
 
-    def poll(self, cls, context: BpyContext):
+    @classmethod
+    def poll(cls, operator_cls, context: BpyContext):
         """
         Check if pose asset lip-sync animation can be performed in the current context.
 
         This method verifies that an armature is selected, has the necessary properties,
         and that the system is ready for pose asset animation.
 
-        :param cls: The class calling this poll method.
+        :param operator_cls: The operator class calling this poll method.
         :param context: The current Blender context.
         :type context: BpyContext
         :return: True if pose asset animation can be performed, False otherwise.
@@ -647,6 +717,6 @@ class LIPSYNC2D_PoseAssetsAnimator:
         :return: The corrected end frame for the word.
         :rtype: int
         """
-        return word_start_frame + round(
-            visemes_data["visemes_parts"] * (visemes_data["visemes_len"] - 1)
+        return corrected_end_frame(
+            word_start_frame, visemes_data["visemes_parts"], visemes_data["visemes_len"]
         )
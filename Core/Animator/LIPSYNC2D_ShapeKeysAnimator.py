@@ -1,9 +1,12 @@
+import sys
 from typing import Any, Iterator, cast
 
 import bpy
 
 
-from ..phoneme_to_viseme import viseme_items_mpeg4_v2
+from .LIPSYNC2D_KeyframeWriter import LIPSYNC2D_KeyframeWriter
+from .kernels import corrected_end_frame, viseme_frames
+from ..phoneme_to_viseme import VISEME_ITEMS, VISEMES
 
 from ..Timeline.LIPSYNC2D_TimeConversion import LIPSYNC2D_TimeConversion
 from ...Core.constants import ACTION_SUFFIX_NAME, SLOT_SHAPE_KEY_NAME
@@ -21,6 +24,8 @@ from ...lipsync_types import (
     BpyShapeKey,
 )
 
+SILENCE_VISEME = sys.intern("sil")
+
 
 class LIPSYNC2D_ShapeKeysAnimator:
     """
@@ -52,6 +57,8 @@ class LIPSYNC2D_ShapeKeysAnimator:
         self.time_conversion = None
         self.close_motion_duration = -1
         self.channelbag: BpyActionChannelbag
+        self._pending_keyframes: list[dict[float, float]] = []
+        self._viseme_shape_keys: dict[str, str] = {}
 
     @staticmethod
     def get_shape_key_action(obj: BpyObject):
@@ -138,15 +145,19 @@ class LIPSYNC2D_ShapeKeysAnimator:
         self.is_last_word = is_last_word
         self.is_first_word = word_index == 0
 
+        # A word without visemes has nothing to key, only first and last words still need their silences
+        if visemes_data["visemes_len"] == 0 and not self.is_first_word and not self.is_last_word:
+            return
+
         # Insert silences before or after word when needed
         self.insert_silences(visemes_data, word_index)
 
-        # Iterate through visemes and insert keyframes on time
+        # Iterate through visemes and buffer keyframes on time
         for shape_key_anim_data in self._insert_on_visemes(
             obj, props, visemes_data, word_timing
         ):
 
-            for fcurve in self.channelbag.fcurves:
+            for fcurve, pending in zip(self.channelbag.fcurves, self._pending_keyframes):
                 fcurve: bpy.types.FCurve
                 shape_key_name = shape_key_anim_data["shape_key"]
                 shape_key_data_path = f'key_blocks["{shape_key_name}"].value'
@@ -155,9 +166,7 @@ class LIPSYNC2D_ShapeKeysAnimator:
                     if shape_key_data_path == fcurve.data_path
                     else 0
                 )
-                fcurve.keyframe_points.insert(
-                    shape_key_anim_data["frame"], value=value, options={"FAST"}
-                )
+                pending[shape_key_anim_data["frame"]] = value
                 self.inserted_keyframes += 1
 
     def insert_silences(self, visemes_data: VisemeData, word_index: int):
@@ -168,7 +177,7 @@ class LIPSYNC2D_ShapeKeysAnimator:
 
         if add_sil_at_word_end:
 
-            for fcurve in self.channelbag.fcurves:
+            for fcurve, pending in zip(self.channelbag.fcurves, self._pending_keyframes):
                 fcurve: bpy.types.FCurve
                 # Define data-path and value
 
@@ -193,7 +202,7 @@ class LIPSYNC2D_ShapeKeysAnimator:
                         ),
                     )
 
-                    fcurve.keyframe_points.insert(frame, value=value, options={"FAST"})
+                    pending[frame] = value
                     self.inserted_keyframes += 1
 
                     # Add silence just before the next word.
@@ -205,23 +214,23 @@ class LIPSYNC2D_ShapeKeysAnimator:
                         + self.delay_until_next_word
                         - max(1, self.in_between_frame_threshold)
                     )
-                    fcurve.keyframe_points.insert(frame, value=value, options={"FAST"})
+                    pending[frame] = value
                     self.inserted_keyframes += 1
 
                 elif self.is_last_word:
                     frame = corrected_word_end_frame + self.close_motion_duration
-                    fcurve.keyframe_points.insert(frame, value=value, options={"FAST"})
+                    pending[frame] = value
                     self.inserted_keyframes += 1
 
         if self.is_first_word:
-            for fcurve in self.channelbag.fcurves:
+            for fcurve, pending in zip(self.channelbag.fcurves, self._pending_keyframes):
                 fcurve: bpy.types.FCurve
                 value = 1 if silence_data_path == fcurve.data_path else 0
                 frame = max(
                     LIPSYNC2D_Timeline.get_frame_start(),
                     self.word_start_frame - max(1, self.close_motion_duration),
                 )
-                fcurve.keyframe_points.insert(frame, value=value, options={"FAST"})
+                pending[frame] = value
 
     def _insert_on_visemes(
         self,
@@ -255,13 +264,17 @@ class LIPSYNC2D_ShapeKeysAnimator:
                 "viseme_index": -1,
             }
 
-        visemes = enumerate(visemes_data["visemes"])
+        frames = viseme_frames(
+            word_timing["word_frame_start"],
+            visemes_data["visemes_parts"],
+            visemes_data["visemes_len"],
+        )
+        last_viseme_index = visemes_data["visemes_len"] - 1
 
-        for viseme_index, v in visemes:
-            self.is_last_viseme = (viseme_index + 1) == visemes_data["visemes_len"]
-            viseme_frame_start = word_timing["word_frame_start"] + round(
-                viseme_index * visemes_data["visemes_parts"]
-            )
+        for viseme_index, (v, viseme_frame_start) in enumerate(
+            zip(visemes_data["visemes"], frames)
+        ):
+            self.is_last_viseme = viseme_index == last_viseme_index
 
             if (
                 # Do not insert a keyframe on a frame that already contains a keyframed shapekey
@@ -282,7 +295,7 @@ class LIPSYNC2D_ShapeKeysAnimator:
             }
 
             self.previous_start = viseme_frame_start
-            self.previous_viseme = v
+            self.previous_viseme = sys.intern(v)
 
     def has_already_a_kframe(self, viseme_frame_start):
         return viseme_frame_start == self.previous_start
@@ -293,15 +306,30 @@ class LIPSYNC2D_ShapeKeysAnimator:
         )
 
     def is_redundant(self, props: BpyPropertyGroup, v: str):
-        if self.previous_viseme is None or self.previous_viseme == "sil":
+        # previous_viseme and shape key names are interned, so identity is equality
+        if self.previous_viseme is None or self.previous_viseme is SILENCE_VISEME:
             return False
 
-        previous_viseme_prop_name = getattr(
-            props, f"lip_sync_2d_viseme_shape_keys_{self.previous_viseme}"
-        )
-        viseme_prop_name = getattr(props, f"lip_sync_2d_viseme_shape_keys_{v}")
+        return self._viseme_shape_keys[self.previous_viseme] is self._viseme_shape_keys[v]
+
+    def flush_keyframes(self, obj: BpyObject):
+        """
+        Write every buffered keyframe into its F-Curve.
+
+        Keyframes are buffered per F-Curve while words are processed, then written in a
+        single bulk operation per F-Curve, so handles are recomputed once per curve
+        instead of once per inserted point.
 
-        return previous_viseme_prop_name == viseme_prop_name
+        :param obj: The Blender object being animated.
+        :type obj: BpyObject
+        """
+        if not self._pending_keyframes:
+            return
+
+        for fcurve, pending in zip(self.channelbag.fcurves, self._pending_keyframes):
+            LIPSYNC2D_KeyframeWriter.write(fcurve, pending, "LINEAR")
+
+        self._pending_keyframes = [{} for _ in self._pending_keyframes]
 
     def set_interpolation(self, obj: BpyObject):
         """
@@ -322,13 +350,7 @@ class LIPSYNC2D_ShapeKeysAnimator:
         channelbag = strip.channelbag(self._slot, ensure=True)
 
         for fcurve in channelbag.fcurves:
-            for fcurve in (
-                cast(BpyActionKeyframeStrip, action.layers[0].strips[0])
-                .channelbag(action.slots.get(f"KE{SLOT_SHAPE_KEY_NAME}"))
-                .fcurves
-            ):
-                for keyframe in fcurve.keyframe_points:
-                    keyframe.interpolation = "LINEAR"
+            LIPSYNC2D_KeyframeWriter.set_interpolation(fcurve, "LINEAR")
 
     @staticmethod
     def reset_shape_keys(key_blocks: Any, viseme_frame_start: float | None = None):
@@ -394,6 +416,10 @@ class LIPSYNC2D_ShapeKeysAnimator:
         self.previous_viseme = None
         self.inserted_keyframes = 0
         self.props = props
+        self._viseme_shape_keys = {
+            viseme: sys.intern(getattr(props, f"lip_sync_2d_viseme_shape_keys_{viseme}"))
+            for viseme in VISEMES
+        }
 
     def setup_animation_properties(self, obj: BpyObject):
         _, strip = self.set_up_action(obj)
@@ -404,10 +430,9 @@ class LIPSYNC2D_ShapeKeysAnimator:
         self.setup_fcurves(obj, strip)
 
     def get_available_shape_key_names(self):
-        visemes = viseme_items_mpeg4_v2(None, None)
         available_shape_keys = [
             key
-            for (enum_id, _, _) in visemes
+            for (enum_id, _, _) in VISEME_ITEMS
             if (key := getattr(self.props, f"lip_sync_2d_viseme_shape_keys_{enum_id}"))
             != "NONE"
         ]
@@ -438,6 +463,8 @@ class LIPSYNC2D_ShapeKeysAnimator:
             if fcurves.find(shape_key_data_path) is None:
                 fcurves.new(shape_key_data_path)
 
+        self._pending_keyframes = [{} for _ in fcurves]
+
     def set_up_action(
         self, obj: BpyObject
     ) -> tuple[BpyAction, BpyActionKeyframeStrip] | tuple[None, None]:
@@ -462,9 +489,7 @@ class LIPSYNC2D_ShapeKeysAnimator:
             strip = cast(
                 bpy.types.ActionKeyframeStrip, layer.strips.new(type="KEYFRAME")
             )
-            obj.data.shape_keys.animation_data.action = action
         else:
-            obj.data.shape_keys.animation_data.action = action
             layer = action.layers[0]
             strip = cast(bpy.types.ActionKeyframeStrip, layer.strips[0])
 
@@ -472,15 +497,20 @@ class LIPSYNC2D_ShapeKeysAnimator:
             id_type="KEY", name=f"{SLOT_SHAPE_KEY_NAME}"
         )
 
-        obj.data.shape_keys.animation_data.action = action
-        obj.data.shape_keys.animation_data.action_slot = self._slot
+        # Assigning action or slot tags the depsgraph, so only write them when they change
+        anim_data = obj.data.shape_keys.animation_data
+        if anim_data.action != action:
+            anim_data.action = action
+        if anim_data.action_slot != self._slot:
+            anim_data.action_slot = self._slot
 
         return action, strip
 
     def cleanup(self, obj: BpyObject):
         pass
 
-    def poll(self, cls, context: BpyContext):
+    @classmethod
+    def poll(cls, operator_cls, context: BpyContext):
         obj = context.active_object
 
         if obj is None or not isinstance(obj.data, bpy.types.Mesh):
@@ -497,6 +527,6 @@ class LIPSYNC2D_ShapeKeysAnimator:
 
     @staticmethod
     def get_corrected_end_frame(word_start_frame, visemes_data: VisemeData) -> int:
-        return word_start_frame + round(
-            visemes_data["visemes_parts"] * (visemes_data["visemes_len"] - 1)
+        return corrected_end_frame(
+            word_start_frame, visemes_data["visemes_parts"], visemes_data["visemes_len"]
         )
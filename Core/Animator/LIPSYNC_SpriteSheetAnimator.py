@@ -1,4 +1,7 @@
+import bisect
+
 import bpy
+import numpy as np
 from typing import cast
 
 from ...Preferences.LIPSYNC2D_AP_Preferences import LIPSYNC2D_AP_Preferences
@@ -6,9 +9,14 @@ from ...Core.constants import ACTION_SUFFIX_NAME, SLOT_SPRITE_SHEET_NAME
 from ...Core.Timeline.LIPSYNC2D_Timeline import LIPSYNC2D_Timeline
 from ...Core.types import VisemeData, WordTiming
 from ...lipsync_types import BpyAction, BpyActionChannelbag, BpyActionSlot, BpyActionKeyframeStrip, BpyContext, BpyObject, BpyPropertyGroup
+from .LIPSYNC2D_KeyframeWriter import LIPSYNC2D_KeyframeWriter
 from .LIPSYNC2D_ShapeKeysAnimator import LIPSYNC2D_ShapeKeysAnimator
+from .kernels import viseme_frames
+from ..phoneme_to_viseme import VISEME_IDS, VISEMES
 from ..Timeline.LIPSYNC2D_TimeConversion import LIPSYNC2D_TimeConversion
 
+SPRITE_SHEET_INDEX_DATA_PATH = 'lipsync2d_props.lip_sync_2d_sprite_sheet_index'
+
 class LIPSYNC_SpriteSheetAnimator:
     """
     Class responsible for handling sprite sheet animation specifically for lipsync. It provides functionalities
@@ -42,6 +50,11 @@ class LIPSYNC_SpriteSheetAnimator:
         self.is_first_word = False
         self.time_conversion: LIPSYNC2D_TimeConversion | None = None
         self.channelbag: BpyActionChannelbag
+        self._sprite_fcurve: bpy.types.FCurve | None = None
+        self._pending_keyframes: dict[float, float] = {}
+        self._keyed_frames: list[float] = []
+        self._sprite_values: np.ndarray = np.empty(0, dtype=np.int32)
+        self._silence_sprite: int = -1
 
     def clear_previous_keyframes(self, obj: BpyObject):
         """
@@ -60,7 +73,7 @@ class LIPSYNC_SpriteSheetAnimator:
         action = obj.animation_data.action if obj.animation_data else None
         if action:
             for fcurve in action.fcurves:
-                if fcurve.data_path == "lipsync2d_props.lip_sync_2d_sprite_sheet_index":
+                if fcurve.data_path == SPRITE_SHEET_INDEX_DATA_PATH:
                     fcurve.keyframe_points.clear()
 
     def insert_keyframes(self, obj: BpyObject, props: BpyPropertyGroup, visemes_data: VisemeData,
@@ -89,51 +102,71 @@ class LIPSYNC_SpriteSheetAnimator:
         self.is_last_word = is_last_word
         self.is_first_word = word_index == 0
 
-        # Insert silences before or after word when needed
-        self.insert_silences(props, visemes_data)
+        # A word without visemes has nothing to key, only first and last words still need their silences
+        if visemes_data["visemes_len"] == 0 and not self.is_first_word and not self.is_last_word:
+            return
 
-        # Iterate through visemes and insert keyframes on time
-        for shape_key_anim_data in self._insert_on_visemes(obj, props, visemes_data, word_timing):
+        # Silences are buffered before visemes, so a viseme wins when both land on the same frame
+        silences_before = list(self._silences_before_word())
+        silences_after = list(self._silences_after_word(visemes_data))
+        events = [
+            *silences_before,
+            *silences_after,
+            *self._insert_on_visemes(obj, props, visemes_data, word_timing),
+        ]
 
-            for fcurve in self.channelbag.fcurves:
-                fcurve: bpy.types.FCurve
-                value = shape_key_anim_data["value"]
-                fcurve.keyframe_points.insert(shape_key_anim_data["frame"], value=value, options={"FAST"})
-                self.inserted_keyframes += 1
+        for event in events:
+            self.buffer_keyframe(event["frame"], event["value"])
 
-    def insert_silences(self, props, visemes_data):
-        add_sil_at_word_end = (self.delay_until_next_word > self.silence_frame_threshold) or self.is_last_word
+        # Silences of this word are bound to be close to its visemes, so they are only
+        # taken into account from the next word on
+        for event in (*silences_before, *silences_after):
+            bisect.insort(self._keyed_frames, event["frame"])
 
-        if add_sil_at_word_end:
+    def _silences_before_word(self):
+        """
+        Yield the silence opening the first word, placed a bit before the word starts.
 
-            for fcurve in self.channelbag.fcurves:
-                fcurve: bpy.types.FCurve
-                # Define data-path and value
+        :return: Frame and value of each silence.
+        """
+        if self.is_first_word:
+            yield {
+                "frame": max(LIPSYNC2D_Timeline.get_frame_start(),
+                             self.word_start_frame - max(1, self.in_between_frame_threshold)),
+                "value": self._silence_sprite,
+            }
 
-                value = props[f"lip_sync_2d_viseme_sil"]
+    def _silences_after_word(self, visemes_data: VisemeData):
+        """
+        Yield the silence closing a word, when the next word is far enough or when this is the last word.
+
+        :param visemes_data: Data about visemes, including their order and division details.
+        :return: Frame and value of each silence.
+        """
+        add_sil_at_word_end = (self.delay_until_next_word > self.silence_frame_threshold) or self.is_last_word
 
-                # Last viseme is inserted a bit before end of word. This ensures that silence uses correct timing
-                corrected_word_end_frame = LIPSYNC2D_ShapeKeysAnimator.get_corrected_end_frame(self.word_start_frame,
-                                                                                               visemes_data)
+        if add_sil_at_word_end:
+            # Last viseme is inserted a bit before end of word. This ensures that silence uses correct timing
+            corrected_word_end_frame = LIPSYNC2D_ShapeKeysAnimator.get_corrected_end_frame(self.word_start_frame,
+                                                                                           visemes_data)
 
-                # Add silence after current word
-                #TODO previous_start is not updated although new keyframe is inserted. see how to update it
-                frame = corrected_word_end_frame + self.in_between_frame_threshold
-                fcurve.keyframe_points.insert(frame, value=value, options={"FAST"})
-                self.inserted_keyframes += 1
+            # Add silence after current word
+            yield {
+                "frame": corrected_word_end_frame + self.in_between_frame_threshold,
+                "value": self._silence_sprite,
+            }
 
-                if self.is_last_word:
-                    frame = corrected_word_end_frame + self.in_between_frame_threshold
-                    fcurve.keyframe_points.insert(frame, value=value, options={"FAST"})
-                    self.inserted_keyframes += 1
+    def buffer_keyframe(self, frame: float, value: float):
+        """
+        Buffer a keyframe for the sprite sheet index F-Curve. Buffered keyframes are written by
+        `flush_keyframes`. A later keyframe on the same frame replaces the previous one, as
+        keyframe_points.insert would.
 
-        if self.is_first_word:
-            for fcurve in self.channelbag.fcurves:
-                fcurve: bpy.types.FCurve
-                value = props["lip_sync_2d_viseme_sil"]
-                frame = max(LIPSYNC2D_Timeline.get_frame_start(),
-                            self.word_start_frame - max(1, self.in_between_frame_threshold))
-                fcurve.keyframe_points.insert(frame, value=value, options={"FAST"})
+        :param frame: Frame of the keyframe.
+        :param value: Value of the keyframe.
+        :return: None
+        """
+        self._pending_keyframes[frame] = value
 
     def _insert_on_visemes(self, obj: BpyObject, props: BpyPropertyGroup, visemes_data: VisemeData,
                          word_timing: WordTiming):
@@ -154,20 +187,20 @@ class LIPSYNC_SpriteSheetAnimator:
         :param is_last_word: A boolean indicating whether the current word is the last word in the sequence.
         :return: None
         """
-        visemes = enumerate(visemes_data["visemes"])
-        for viseme_index, v in visemes:
-            self.is_last_viseme = (viseme_index + 1) == visemes_data["visemes_len"]
-            viseme_frame_start = word_timing["word_frame_start"] + round(viseme_index * visemes_data["visemes_parts"])
-            sprite_index = props[f"lip_sync_2d_viseme_{v}"]
-
-            if (
-                    # Do not insert a keyframe on a frame that already contains a keyframed shapekey
-                    self.has_already_a_kframe(viseme_frame_start)
-                    # Do not insert a keyframe if previous keyframe is too close
-                    or self.is_prev_kframe_too_close(viseme_frame_start)
-                    # Do not insert a keyframe if previous keyframed shapekey was for the same viseme
-                    or self.is_redundant(props, v)
-                    ):
+        frames = viseme_frames(word_timing["word_frame_start"], visemes_data["visemes_parts"],
+                               visemes_data["visemes_len"])
+        last_viseme_index = visemes_data["visemes_len"] - 1
+        visemes = visemes_data["visemes"]
+        # Sprite index of every viseme of the word, gathered at once by viseme id
+        viseme_ids = np.fromiter((VISEME_IDS[v] for v in visemes), dtype=np.intp, count=len(visemes))
+        sprite_values = self._sprite_values[viseme_ids].tolist()
+
+        for viseme_index, (v, viseme_frame_start, sprite_index) in enumerate(zip(visemes, frames, sprite_values)):
+            self.is_last_viseme = viseme_index == last_viseme_index
+
+            # Do not insert a keyframe on a frame that already has one, or too close to another keyframe.
+            # Repeated sprites are removed when flushing, once silences and visemes are in frame order.
+            if self.is_frame_taken(viseme_frame_start):
                 continue
 
             yield {
@@ -175,40 +208,87 @@ class LIPSYNC_SpriteSheetAnimator:
                 "viseme": v,
                 "viseme_index": viseme_index,
                 "value": sprite_index,
-                "shape_key": getattr(props, "lip_sync_2d_sprite_sheet_index")
             }
 
             self.previous_start = viseme_frame_start
             self.previous_viseme = v
-    
-    def has_already_a_kframe(self, viseme_frame_start):
-        return viseme_frame_start == self.previous_start
-
-    def is_prev_kframe_too_close(self, viseme_frame_start):
-        return self.previous_start >= 0 and (
-                (viseme_frame_start - self.previous_start) <= self.in_between_frame_threshold)
-    
-    def is_redundant(self, props: BpyPropertyGroup, v: str):
-        if self.previous_viseme is None or self.previous_viseme == "sil":
-            return False
-        
+            bisect.insort(self._keyed_frames, viseme_frame_start)
+
+    def is_frame_taken(self, frame: float) -> bool:
+        """
+        Check whether a frame already holds a keyframe, or is within the in-between threshold
+        of one. Keyed frames are kept sorted, so only the two closest neighbours are checked.
+
+        :param frame: The frame to check.
+        :return: True if a keyframe should not be inserted on this frame.
+        """
+        keyed_frames = self._keyed_frames
+        index = bisect.bisect_left(keyed_frames, frame)
+
+        if index < len(keyed_frames) and keyed_frames[index] - frame <= self.in_between_frame_threshold:
+            return True
+
+        return index > 0 and frame - keyed_frames[index - 1] <= self.in_between_frame_threshold
+
+    def flush_keyframes(self, obj: BpyObject):
+        """
+        Write all buffered keyframes into the sprite sheet index F-Curve, in a single bulk write.
+
+        :param obj: The object being animated.
+        :type obj: BpyObject
+        :return: None
+        """
+        if not self._pending_keyframes or self._sprite_fcurve is None:
+            return
+
+        keyframes = self._pending_keyframes
+        # Existing keyframes may sit between buffered ones, so runs can only be collapsed on an empty F-Curve
+        if len(self._sprite_fcurve.keyframe_points) == 0:
+            keyframes = self.remove_repeated_values(keyframes)
+
+        self.inserted_keyframes += LIPSYNC2D_KeyframeWriter.write(self._sprite_fcurve, keyframes, 'CONSTANT')
+
+        self._pending_keyframes = {}
+
+    @staticmethod
+    def remove_repeated_values(keyframes: dict[float, float]) -> dict[float, float]:
+        """
+        Drop every keyframe holding the same value as the keyframe right before it. With CONSTANT
+        interpolation such keyframes do not change the animation. The whole transcript is reduced
+        in a single vectorized pass.
+
+        :param keyframes: Mapping of frame to value.
+        :return: Mapping of frame to value, without repeated values.
+        """
+        frames = np.fromiter(keyframes.keys(), dtype=np.float64, count=len(keyframes))
+        values = np.fromiter(keyframes.values(), dtype=np.float64, count=len(keyframes))
+
+        order = np.argsort(frames, kind="stable")
+        frames = frames[order]
+        values = values[order]
+
+        keep = np.empty(len(values), dtype=bool)
+        keep[:1] = True
+        np.not_equal(values[1:], values[:-1], out=keep[1:])
+
+        return dict(zip(frames[keep].tolist(), values[keep].tolist()))
+
     def set_interpolation(self, obj: BpyObject):
         """
-        Sets the interpolation mode of keyframes in the animation action of a given object
-        to 'CONSTANT'. This operation affects all keyframe points of all f-curves within the
-        action, modifying their interpolation behavior.
+        Sets the interpolation mode of the sprite sheet index keyframes to 'CONSTANT'. Only the
+        F-Curve resolved by `setup_fcurves` is touched, with all of its keyframe points written
+        at once.
 
-        :param obj: The object whose animation action keyframe interpolation will be
-                    modified. It must have animation data with an action to apply changes.
+        :param obj: The object whose sprite sheet keyframe interpolation will be modified.
         :type obj: BpyObject
         :return: None
         """
-        action = obj.animation_data.action if obj.animation_data else None
+        fcurve = self._sprite_fcurve
 
-        if action:
-            for fcurve in action.fcurves:
-                for keyframe in fcurve.keyframe_points:
-                    keyframe.interpolation = 'CONSTANT'
+        if fcurve is None:
+            return
+
+        LIPSYNC2D_KeyframeWriter.set_interpolation(fcurve, 'CONSTANT')
 
     def setup(self, obj: BpyObject):
         self.setup_animation_properties(obj)
@@ -228,6 +308,12 @@ class LIPSYNC_SpriteSheetAnimator:
         self.previous_start = -1
         self.previous_viseme = None
         self.inserted_keyframes = 0
+        self._pending_keyframes = {}
+        self._keyed_frames = []
+        # Sprite index of every viseme, indexed by viseme id and read once instead of on each inserted viseme
+        self._sprite_values = np.fromiter((getattr(props, f"lip_sync_2d_viseme_{v}") for v in VISEMES),
+                                          dtype=np.int32, count=len(VISEMES))
+        self._silence_sprite = int(self._sprite_values[VISEME_IDS["sil"]])
 
     def setup_animation_properties(self, obj: BpyObject):
         _, strip = self.set_up_action(obj)
@@ -245,14 +331,14 @@ class LIPSYNC_SpriteSheetAnimator:
         props = obj.lipsync2d_props  # type: ignore
         self.channelbag = strip.channelbag(self._slot, ensure=True)
 
-        data_path = 'lipsync2d_props.lip_sync_2d_sprite_sheet_index'
+        data_path = SPRITE_SHEET_INDEX_DATA_PATH
         fcurves = self.channelbag.fcurves
 
         if props.lip_sync_2d_use_clear_keyframes:
             fcurves.clear()
         
-        if fcurves.find(data_path) is None:
-            fcurves.new(data_path)
+        # Only this F-Curve is animated, so it is looked up once instead of walking the channelbag
+        self._sprite_fcurve = fcurves.find(data_path) or fcurves.new(data_path)
 
 
     def set_up_action(self, obj: BpyObject) -> tuple[BpyAction, BpyActionKeyframeStrip] | tuple[None, None]:
@@ -272,22 +358,26 @@ class LIPSYNC_SpriteSheetAnimator:
             action = bpy.data.actions.new(f"{obj_name}-{ACTION_SUFFIX_NAME}")
             layer = action.layers.new("Layer")
             strip = cast(bpy.types.ActionKeyframeStrip, layer.strips.new(type='KEYFRAME'))
-            obj.animation_data.action = action
         else:
             layer = action.layers[0]
             strip = cast(bpy.types.ActionKeyframeStrip, layer.strips[0])
 
         self._slot = action.slots.get(f"OB{SLOT_SPRITE_SHEET_NAME}") or action.slots.new(id_type='OBJECT', name=SLOT_SPRITE_SHEET_NAME)
 
-        obj.animation_data.action = action
-        obj.animation_data.action_slot = self._slot
+        # Assigning action or slot tags the depsgraph, so only write them when they change
+        anim_data = obj.animation_data
+        if anim_data.action != action:
+            anim_data.action = action
+        if anim_data.action_slot != self._slot:
+            anim_data.action_slot = self._slot
 
         return action, strip
 
     def cleanup(self, obj: BpyObject):
         pass
 
-    def poll(self, cls, context: BpyContext):
+    @classmethod
+    def poll(cls, operator_cls, context: BpyContext):
         model_state = LIPSYNC2D_AP_Preferences.get_model_state()
 
         return (context.scene is not None or context.active_object is not None) and model_state != "DOWNLOADING"
@@ -0,0 +1,92 @@
+from typing import Sequence
+
+import numpy as np
+
+
+def compute_keep_mask(
+    viseme_ids: Sequence[int],
+    frames: Sequence[int],
+    priorities: Sequence[int],
+    pose_ids: Sequence[int],
+    unskippable: Sequence[bool],
+    silence_id: int,
+    threshold: float,
+    force_lips_contact: bool,
+    previous_start: int,
+    previous_id: int,
+) -> tuple[list[bool], int, int]:
+    """
+    Decide which visemes of a word should be keyed.
+
+    Runs the whole skip logic (priority conflict, redundancy and timing) over a word in a
+    single loop working on integer viseme ids, instead of going through several method
+    calls and string lookups per viseme.
+
+    :param viseme_ids: Viseme ids of the word, in order.
+    :param frames: Start frame of each viseme.
+    :param priorities: Priority of each viseme id. Lower number = higher priority.
+    :param pose_ids: Identifier of the pose mapped to each viseme id. Visemes sharing a pose share the same identifier.
+    :param unskippable: Whether each viseme id should be kept despite timing conflicts when accuracy is prioritized.
+    :param silence_id: Viseme id of the silence viseme.
+    :param threshold: Minimum number of frames between two keyframes.
+    :param force_lips_contact: Keep unskippable visemes even when they are too close to the previous one.
+    :param previous_start: Frame of the last keyed viseme, or -1.
+    :param previous_id: Viseme id of the last keyed viseme, or -1.
+    :return: A keep flag for each viseme, followed by the updated previous_start and previous_id.
+    :rtype: tuple[list[bool], int, int]
+    """
+    keep = [False] * len(viseme_ids)
+
+    for index, (viseme_id, frame) in enumerate(zip(viseme_ids, frames)):
+        if previous_id >= 0:
+            # Skip if previous viseme at same frame has higher priority
+            if frame == previous_start and priorities[viseme_id] > priorities[previous_id]:
+                continue
+
+            # Skip if redundant with previous viseme
+            if previous_id != silence_id and pose_ids[previous_id] == pose_ids[viseme_id]:
+                continue
+
+        # Handle timing conflicts
+        if previous_start >= 0 and frame - previous_start <= threshold:
+            if not force_lips_contact or not unskippable[viseme_id]:
+                continue
+
+        keep[index] = True
+        previous_start = frame
+        previous_id = viseme_id
+
+    return keep, previous_start, previous_id
+
+
+def corrected_end_frame(word_start_frame: int, visemes_parts: float, visemes_len: int) -> int:
+    """
+    Frame of the last viseme of a word.
+
+    Last viseme is inserted a bit before the theoretical end of the word, so this is the frame
+    silences and delays must be computed from.
+
+    :param word_start_frame: The starting frame of the word.
+    :param visemes_parts: Duration of each viseme, in frames.
+    :param visemes_len: Number of visemes in the word.
+    :return: The corrected end frame for the word.
+    :rtype: int
+    """
+    return word_start_frame + round(visemes_parts * (visemes_len - 1))
+
+
+def viseme_frames(word_frame_start: int, visemes_parts: float, visemes_len: int) -> list[int]:
+    """
+    Start frame of every viseme of a word.
+
+    Frames are computed in a single vectorized expression. np.rint rounds half to even,
+    so results are the same as calling round() on each viseme.
+
+    :param word_frame_start: The starting frame of the word.
+    :param visemes_parts: Duration of each viseme, in frames.
+    :param visemes_len: Number of visemes in the word.
+    :return: The start frame of each viseme.
+    :rtype: list[int]
+    """
+    offsets = np.rint(np.arange(visemes_len, dtype=np.float64) * visemes_parts)
+    return (offsets.astype(np.int64) + word_frame_start).tolist()
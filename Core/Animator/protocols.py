@@ -21,6 +21,8 @@ class LIPSYNC2D_LipSyncAnimator(Protocol):
     :ivar insert_on_visemes: Inserts keyframes on the animation object based on the provided
         viseme data, word timings, and additional properties.
     :type insert_on_visemes: Callable[[BpyObject, BpyPropertyGroup, VisemeData, WordTiming, int, bool], None]
+    :ivar flush_keyframes: Writes keyframes buffered during insertion into the animation object.
+    :type flush_keyframes: Callable[[BpyObject], None]
     :ivar set_interpolation: Adjusts keyframe interpolation for smoother lip-sync animation.
     :type set_interpolation: Callable[[BpyObject], None]
     :ivar cleanup: Finalizes animation and removes temporary data from the object.
@@ -47,11 +49,15 @@ class LIPSYNC2D_LipSyncAnimator(Protocol):
     ):
         pass
 
+    def flush_keyframes(self, obj: BpyObject):
+        pass
+
     def set_interpolation(self, obj: BpyObject):
         pass
 
     def cleanup(self, obj: BpyObject):
         pass
 
-    def poll(self, cls, context: BpyContext) -> bool:
+    @classmethod
+    def poll(cls, operator_cls, context: BpyContext) -> bool:
         return False
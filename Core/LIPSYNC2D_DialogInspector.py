@@ -1,6 +1,5 @@
-from typing import cast
-
-from phonemizer import phonemize
+from itertools import chain
+from typing import Iterable, cast
 
 from .Timeline.LIPSYNC2D_TimeConversion import LIPSYNC2D_TimeConversion
 from .Animator.LIPSYNC2D_ShapeKeysAnimator import LIPSYNC2D_ShapeKeysAnimator
@@ -14,12 +13,18 @@ from ..lipsync_types import BpyContext, BpyRenderSettings
 
 class LIPSYNC2D_DialogInspector:
     time_conversion: LIPSYNC2D_TimeConversion
+    frame_offset: int
 
     def __init__(self, render_settings: BpyRenderSettings):
         self.time_conversion = LIPSYNC2D_TimeConversion(render_settings)
+        # Scene frame start is read once, instead of twice for every word
+        self.frame_offset = max(0, LIPSYNC2D_Timeline.get_frame_start() - 1)
 
     @staticmethod
     def extract_phonemes(words: list[str], context: BpyContext) -> list[str]:
+        # phonemizer pulls in many dependencies, it is only imported once a bake needs it
+        from phonemizer import phonemize
+
         lang_code = LIPSYNC2D_AP_Preferences.get_current_lang_code()
         iso_639_3 = LIPSYNC2D_ISOLangConverter.convert_iso6391_to_iso6393(lang_code)
         phonemes = cast(list[str], phonemize(words, language=iso_639_3, backend='espeak'))
@@ -31,8 +36,8 @@ class LIPSYNC2D_DialogInspector:
         return phoneme_to_viseme.get(clean, "UNK")
 
     def get_word_timing(self, recognized_word) -> WordTiming:
-        word_frame_start = self.time_conversion.time_to_frame(recognized_word['start']) + max(0,LIPSYNC2D_Timeline.get_frame_start() - 1)
-        word_frame_end = self.time_conversion.time_to_frame(recognized_word['end']) + max(0, LIPSYNC2D_Timeline.get_frame_start() - 1)
+        word_frame_start = self.time_conversion.time_to_frame(recognized_word['start']) + self.frame_offset
+        word_frame_end = self.time_conversion.time_to_frame(recognized_word['end']) + self.frame_offset
         duration = word_frame_end - word_frame_start
 
         return {
@@ -42,27 +47,33 @@ class LIPSYNC2D_DialogInspector:
         }
 
     @staticmethod
-    def get_visemes(phoneme, duration: float) -> VisemeData:
+    def build_phoneme_viseme_table(phonemes: Iterable[str]) -> dict[str, str]:
+        """
+        Map every IPA character found in the given phonemes to its viseme, so each distinct
+        character is only converted once for the whole dialog.
+
+        :param phonemes: Phonemes of every word.
+        :return: Viseme of each distinct IPA character.
+        :rtype: dict[str, str]
+        """
+        return {
+            ipa_phoneme: LIPSYNC2D_DialogInspector.ipaphoneme_to_viseme(ipa_phoneme)
+            for ipa_phoneme in set(chain.from_iterable(phonemes))
+        }
+
+    @staticmethod
+    def get_visemes(phoneme, duration: float, table: dict[str, str] | None = None) -> VisemeData:
         phoneme = phoneme.strip()
-        visemes = [LIPSYNC2D_DialogInspector.ipaphoneme_to_viseme(p) for p in phoneme]
+        if table is None:
+            visemes = [LIPSYNC2D_DialogInspector.ipaphoneme_to_viseme(p) for p in phoneme]
+        else:
+            visemes = [table[p] for p in phoneme]
         visemes_no_sil = [v for v in visemes if v != "sil"]
         visemes_len = len(visemes_no_sil)
-        visemes_parts = duration / len(visemes_no_sil)
+        visemes_parts = duration / visemes_len if visemes_len else 0.0
 
         return {
             "visemes": visemes_no_sil,
             "visemes_len": visemes_len,
             "visemes_parts": visemes_parts,
         }
-
-    def get_next_word_timing(self, recognized_words, index: int) -> WordTiming:
-        result: WordTiming = {
-            "word_frame_start": -1,
-            "word_frame_end": -1,
-            "duration": -1,
-        }
-
-        if index + 1 >= len(recognized_words):
-            return result
-
-        return self.get_word_timing(recognized_words[index + 1])
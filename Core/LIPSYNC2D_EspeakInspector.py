@@ -5,7 +5,6 @@ import zipfile
 from typing import cast
 
 import bpy
-from phonemizer.backend import EspeakBackend
 
 from ..LIPSYNC2D_Utils import get_package_name
 
@@ -34,15 +33,17 @@ class LIPSYNC2D_EspeakInspector():
 
     @staticmethod
     def set_espeak_backend():
+        # phonemizer reads the library path from the environment when it first needs espeak,
+        # so it does not have to be imported when the add-on is enabled
         plat = str.lower(platform.system())
         espeak_extraction_path = LIPSYNC2D_EspeakInspector.get_espeak_extraction_path()
         output_path = pathlib.Path(espeak_extraction_path)
         if plat == "windows":
-            EspeakBackend.set_library(output_path / "libespeak-ng.dll")
+            os.environ["PHONEMIZER_ESPEAK_LIBRARY"] = str(output_path / "libespeak-ng.dll")
         elif plat == "linux":
-            EspeakBackend.set_library(output_path / "libespeak-ng.so")
+            os.environ["PHONEMIZER_ESPEAK_LIBRARY"] = str(output_path / "libespeak-ng.so")
         elif plat == "darwin":
-            EspeakBackend.set_library(output_path / "libespeak-ng.dylib")
+            os.environ["PHONEMIZER_ESPEAK_LIBRARY"] = str(output_path / "libespeak-ng.dylib")
         else:
             raise Exception(f"Unsupported platform: {plat}")
 
@@ -1,4 +1,5 @@
 import json
+import operator
 import os
 import pathlib
 import subprocess
@@ -11,6 +12,13 @@ from vosk import MODEL_DIRS, MODEL_LIST_URL
 
 from ..LIPSYNC2D_Utils import get_package_name
 
+PACKAGE_NAME = get_package_name()
+
+WORKER_PATH = pathlib.Path(__file__).resolve().parents[1] / "Workers" / "wrk_download_models.py"
+
+# Lets the download worker import the same modules as Blender (vosk, requests...)
+WORKER_PYTHONPATH = os.pathsep.join(sys.path)
+
 
 class LIPSYNC2D_VoskHelper():
     """
@@ -24,17 +32,31 @@ class LIPSYNC2D_VoskHelper():
 
     :ivar worker_proc: Manages the subprocess handling asynchronous language model installation.
     :type worker_proc: subprocess.Popen | None
-    :ivar excluded_lang: A list of language codes to exclude from model selection,
+    :ivar excluded_lang: A set of language codes to exclude from model selection,
         such as unstable languages or ones causing caching issues.
-    :type excluded_lang: list[str]
+    :type excluded_lang: frozenset[str]
+    :ivar _path_cache: Extension paths, keyed by subfolder.
+    :type _path_cache: dict[str, pathlib.Path]
+    :ivar _langs_cache: Modification time and parsed content of the languages list file.
+    :type _langs_cache: tuple[int, list] | None
+    :ivar _model_dirs_cache: Path and modification time of the last scanned models cache directory, and its directory names.
+    :type _model_dirs_cache: tuple[tuple[pathlib.Path, int], list[str]] | None
     """
     worker_proc: subprocess.Popen | None = None
+    # Language getters are called by EnumProperty items callbacks on every UI redraw,
+    # so filesystem lookups are cached and only refreshed when files change on disk
+    _path_cache: dict[str, pathlib.Path] = {}
+    _langs_cache: tuple[int, list] | None = None
+    _model_dirs_cache: tuple[tuple[pathlib.Path, int], list[str]] | None = None
+    # Worker state is checked often right after a download starts, then less and less often
+    worker_poll_interval: float = 0.5
+    worker_max_poll_interval: float = 4.0
     # Langs in this list won't show up in Language Model selection
-    excluded_lang = [
+    excluded_lang: frozenset[str] = frozenset({
         "kz",  # Unstable, throw ASSERTION_FAILED error
         "ua"
         # Vosk uses ua to identify Ukrainian but store a model named **-uk-**.zip preventing efficient caching and force model to be downloaded each time
-    ]
+    })
 
     @staticmethod
     def setextensionpath(func):
@@ -76,8 +98,66 @@ class LIPSYNC2D_VoskHelper():
         :return: A `pathlib.Path` object pointing to the requested extension path.
         :rtype: pathlib.Path
         """
-        package_name = cast(str, get_package_name())
-        return pathlib.Path(bpy.utils.extension_path_user(package_name, path=subfolder, create=True))
+        path = LIPSYNC2D_VoskHelper._path_cache.get(subfolder)
+
+        if path is None:
+            path = pathlib.Path(bpy.utils.extension_path_user(cast(str, PACKAGE_NAME), path=subfolder, create=True))
+            LIPSYNC2D_VoskHelper._path_cache[subfolder] = path
+
+        return path
+
+    @staticmethod
+    def load_langs_list() -> list:
+        """
+        Load the cached languages list file. The parsed content is kept in memory and the file is
+        only parsed again when its modification time changes.
+
+        :raises Exception: Raised when there is an error loading the cached file.
+        :return: The languages list, or an empty list if the file does not exist.
+        :rtype: list
+        """
+        cached_langs_list_file = LIPSYNC2D_VoskHelper.get_language_list_file()
+
+        try:
+            mtime = cached_langs_list_file.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        cache = LIPSYNC2D_VoskHelper._langs_cache
+        if cache is not None and cache[0] == mtime:
+            return cache[1]
+
+        try:
+            # json.loads decodes UTF-8 bytes directly, no need for a text-mode file wrapper
+            langs_list = json.loads(cached_langs_list_file.read_bytes())
+        except Exception as e:
+            raise Exception(f"Error while loading cached files index. {e}")
+
+        LIPSYNC2D_VoskHelper._langs_cache = (mtime, langs_list)
+        return langs_list
+
+    @staticmethod
+    def get_model_dir_names(ext_path: pathlib.Path) -> list[str]:
+        """
+        List the directories of the models cache directory. The listing is kept in memory and the
+        directory is only scanned again when its modification time changes.
+
+        :param ext_path: The path to the cache directory where language models are stored.
+        :type ext_path: pathlib.Path
+        :return: Names of the directories found in the cache directory.
+        :rtype: list[str]
+        """
+        key = (ext_path, ext_path.stat().st_mtime_ns)
+        cache = LIPSYNC2D_VoskHelper._model_dirs_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        # DirEntry already knows its type, unlike Path.is_dir() which needs an extra stat per entry
+        with os.scandir(ext_path) as entries:
+            model_dir_names = [entry.name for entry in entries if entry.is_dir()]
+
+        LIPSYNC2D_VoskHelper._model_dirs_cache = (key, model_dir_names)
+        return model_dir_names
 
     @staticmethod
     def get_available_langs_online() -> list[tuple[str, str, str]]:
@@ -94,29 +174,17 @@ class LIPSYNC2D_VoskHelper():
             - Display text for the language
             - Key representing the language
         """
-        langs_list = []
         all_langs = []
-        cached_langs_list_file = LIPSYNC2D_VoskHelper.get_language_list_file()
-
-        if os.path.isfile(cached_langs_list_file):
-            try:
-                with open(cached_langs_list_file, "r", encoding="utf-8") as f:
-                    langs_list = json.load(f)
-            except Exception as e:
-                raise Exception(f"Error while loading cached files index.{e}")
+        langs_list = LIPSYNC2D_VoskHelper.load_langs_list()
 
         if langs_list:
             # List should already be filtered. This is done as a safety measure.
-            all_langs = [(l["lang"], l["lang_text"]) for l in langs_list if
+            all_langs = [(l["lang"], l["lang_text"], l["lang"]) for l in langs_list if
                          l["lang"] != "all" and l["obsolete"] == "false" and l['type'] == 'small' and l[
                              "lang"] not in LIPSYNC2D_VoskHelper.excluded_lang]
-            all_langs.sort(key=lambda x: x[1])
-
-        all_langs = [('none', "-- None --", "No selection"), ] + all_langs
-
-        enum_items = [(list(l)[0], list(l)[1], list(l)[0]) for l in all_langs]
+            all_langs.sort(key=operator.itemgetter(1))
 
-        return enum_items
+        return [('none', "-- None --", "No selection")] + all_langs
 
     @staticmethod
     def get_available_langs_offline() -> list[tuple[str, str, str]]:
@@ -151,23 +219,17 @@ class LIPSYNC2D_VoskHelper():
         if not ext_path.is_dir():
             return all_offline_langs
 
-        cached_langs_list_file = ext_path / "languages_list.json"
-
-        if cached_langs_list_file.is_file():
-            try:
-                with open(cached_langs_list_file, "r", encoding="utf-8") as f:
-                    langs_list = json.load(f)
-            except Exception as e:
-                raise Exception(f"Error while loading cached files index. {e}")
+        langs_list = LIPSYNC2D_VoskHelper.load_langs_list()
 
+        if langs_list:
             all_dir_names = {
                 lang["name"]: (lang["lang"], lang["lang_text"], lang["lang"])
                 for lang in langs_list
                 if lang["type"] == "small" and lang["obsolete"] == "false"
             }
 
-            all_offline_langs = [all_dir_names[pathlib.Path(model_dir).name] for model_dir in ext_path.iterdir() if
-                                 model_dir.is_dir() and pathlib.Path(model_dir).name in all_dir_names]
+            all_offline_langs = [all_dir_names[model_dir_name] for model_dir_name in
+                                 LIPSYNC2D_VoskHelper.get_model_dir_names(ext_path) if model_dir_name in all_dir_names]
 
         all_offline_langs = [('none', "-- None --", "No selection")] + all_offline_langs
         return all_offline_langs
@@ -189,11 +251,15 @@ class LIPSYNC2D_VoskHelper():
         list_request = requests.get(MODEL_LIST_URL)
         if list_request:
             try:
-                with open(LIPSYNC2D_VoskHelper.get_language_list_file(), "w", encoding="utf-8") as f:
-                    full_list = list_request.json()
-                    filter_list = [item for item in full_list if
-                                   item["type"] == "small" and item["obsolete"] == "false"]
-                    json.dump(filter_list, f, ensure_ascii=False)
+                # Parse and filter before opening the file, so a bad response never truncates the current index
+                filter_list = [item for item in list_request.json() if
+                               item["type"] == "small" and item["obsolete"] == "false"
+                               and item["lang"] not in LIPSYNC2D_VoskHelper.excluded_lang]
+                cached_langs_list_file = LIPSYNC2D_VoskHelper.get_language_list_file()
+                cached_langs_list_file.write_text(json.dumps(filter_list, ensure_ascii=False), encoding="utf-8")
+
+                # The filtered list is already in memory, no need to read it back from disk
+                LIPSYNC2D_VoskHelper._langs_cache = (cached_langs_list_file.stat().st_mtime_ns, filter_list)
             except Exception as e:
                 raise Exception(f"Error while creating cached file index: {e}")
 
@@ -258,25 +324,25 @@ class LIPSYNC2D_VoskHelper():
 
         # Prepare env to ensure process can access to all modules
         env = os.environ.copy()
-        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+        env["PYTHONPATH"] = WORKER_PYTHONPATH
 
         # Get custom cache path to change vosk default one
         vosk_cache_path = LIPSYNC2D_VoskHelper.get_extension_path("cache")
 
         args = [addon_prefs.current_lang, vosk_cache_path]
-        
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)
-        worker_path = os.path.join(project_root, "Workers", "wrk_download_models.py")
 
+        # Worker runs in its own session so that interrupting Blender does not leave a half downloaded model
         LIPSYNC2D_VoskHelper.worker_proc = subprocess.Popen(
-            [sys.executable, worker_path, *args],
+            [sys.executable, str(WORKER_PATH), *args],
             env=env,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-            text=True)
+            close_fds=True,
+            start_new_session=True)
 
-        bpy.app.timers.register(LIPSYNC2D_VoskHelper.check_worker_finished)
+        LIPSYNC2D_VoskHelper.worker_poll_interval = 0.5
+        bpy.app.timers.register(LIPSYNC2D_VoskHelper.check_worker_finished,
+                                first_interval=LIPSYNC2D_VoskHelper.worker_poll_interval)
         return
 
     @staticmethod
@@ -287,24 +353,28 @@ class LIPSYNC2D_VoskHelper():
 
         This method inspects the current state of the `worker_proc` attribute
         belonging to `LIPSYNC2D_VoskHelper`. If the process is still active,
-        it returns 1. If the process has completed execution, the method performs
+        it returns the delay before the next check, doubled on each call up to
+        `worker_max_poll_interval` so that long downloads wake Blender up less
+        often. If the process has completed execution, the method performs
         additional cleanup tasks, such as resetting the `worker_proc` to None,
         retrieving the associated addon preferences from Blender's context,
         and updating the `is_downloading` preference flag for the identified addon
         (if applicable).
 
-        :returns: 1 if the worker process is still active; None otherwise.
-        :rtype: int or None
+        :returns: Delay before next check if the worker process is still active; None otherwise.
+        :rtype: float or None
         """
         if LIPSYNC2D_VoskHelper.worker_proc is None:
             return None
 
         if LIPSYNC2D_VoskHelper.worker_proc.poll() is None:
-            return 1
+            LIPSYNC2D_VoskHelper.worker_poll_interval = min(LIPSYNC2D_VoskHelper.worker_poll_interval * 2,
+                                                            LIPSYNC2D_VoskHelper.worker_max_poll_interval)
+            return LIPSYNC2D_VoskHelper.worker_poll_interval
         else:
             LIPSYNC2D_VoskHelper.worker_proc = None
             all_preferences = bpy.context.preferences
-            package_name = get_package_name()
+            package_name = PACKAGE_NAME
 
             if package_name is None or all_preferences is None or all_preferences.addons is None:
                 return None
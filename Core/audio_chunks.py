@@ -0,0 +1,33 @@
+def merge_chunks_words(
+    chunks_words: list[list[dict]], chunk_starts: list[float], overlap: float
+) -> list[dict]:
+    """
+    Merge the words of overlapping chunks, cutting each overlap at a word boundary.
+
+    Words near the end of a chunk may be truncated by the chunk end. The earlier chunk's words are
+    therefore only kept if they end before the end of the chunk minus half the overlap. The later
+    chunk then goes on from the last kept word: its words are kept if their middle is past the end
+    of that word, so words decoded by both chunks are only kept once, from the chunk holding them whole.
+
+    :param chunks_words: Recognized words of each chunk, with timings relative to the whole audio.
+    :param chunk_starts: Start time of each chunk, in seconds.
+    :param overlap: Duration of the overlap between two consecutive chunks, in seconds.
+    :return: Recognized words of the whole audio.
+    :rtype: list[dict]
+    """
+    # Each chunk ends an overlap after the next one starts, the last chunk ends with the audio
+    chunk_ends = [start + overlap for start in chunk_starts[1:]] + [float("inf")]
+    words = []
+    last_end = float("-inf")
+
+    for chunk_words, chunk_end in zip(chunks_words, chunk_ends):
+        limit = chunk_end - overlap / 2
+        for word in chunk_words:
+            if (word["start"] + word["end"]) / 2 <= last_end:
+                continue
+            if word["end"] > limit:
+                break
+            words.append(word)
+            last_end = word["end"]
+
+    return words
@@ -2,3 +2,11 @@ SLOT_POSE_ASSETS_NAME = "LipSync-PoseAssets"
 SLOT_SHAPE_KEY_NAME = "LipSync-ShapeKeys"
 SLOT_SPRITE_SHEET_NAME = "LipSync-SpriteSheet"
 ACTION_SUFFIX_NAME = "LipSyncAction"
+# Audio longer than two chunks is decoded in parallel, in chunks of this duration (seconds)
+VOSK_CHUNK_SECONDS = 30
+# Consecutive chunks overlap so that words on a chunk boundary are fully decoded by one of them (seconds)
+VOSK_CHUNK_OVERLAP_SECONDS = 5
+# Number of frames fed to the recognizer at once
+VOSK_FEED_FRAMES = 4000
+# RAM backed directory used for the extracted audio when available, to avoid a disk round-trip
+SHARED_MEMORY_DIR = "/dev/shm"
@@ -151,3 +151,12 @@ def phonemes_to_default_sprite_index():
     }
 
     return phoneme_map
+
+
+# Viseme enum items never change, so they are built once and shared
+VISEME_ITEMS = tuple(viseme_items_mpeg4_v2(None, None))
+# Stable integer id for each viseme, following viseme_items_mpeg4_v2 order
+VISEMES = tuple(enum_id for (enum_id, _, _) in VISEME_ITEMS)
+VISEME_IDS = {viseme: index for index, viseme in enumerate(VISEMES)}
+# Whether each viseme id is unskippable, aligned with VISEMES
+UNSKIPPABLE_MASK = tuple(viseme.lower() in UNSKIPPABLE_VISEMES for viseme in VISEMES)
@@ -1,9 +1,11 @@
 import json
 import os
 import wave
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Literal, cast
 
 import bpy
+from bpy.app.handlers import persistent
 from vosk import KaldiRecognizer, Model
 
 from ..Core.Animator.LIPSYNC2D_PoseAssetsAnimator import LIPSYNC2D_PoseAssetsAnimator
@@ -13,10 +15,33 @@ from ..Core.Animator.LIPSYNC_SpriteSheetAnimator import LIPSYNC_SpriteSheetAnima
 from ..Core.Animator.protocols import LIPSYNC2D_LipSyncAnimator
 from ..Core.LIPSYNC2D_DialogInspector import LIPSYNC2D_DialogInspector
 from ..Core.LIPSYNC2D_VoskHelper import LIPSYNC2D_VoskHelper
-from ..Core.Timeline.LIPSYNC2D_Timeline import LIPSYNC2D_Timeline
+from ..Core.audio_chunks import merge_chunks_words
+from ..Core.types import WordTiming
+from ..Core.constants import (
+    SHARED_MEMORY_DIR,
+    VOSK_CHUNK_OVERLAP_SECONDS,
+    VOSK_CHUNK_SECONDS,
+    VOSK_FEED_FRAMES,
+)
 from ..LIPSYNC2D_Utils import get_package_name
 from ..lipsync_types import BpyObject
 
+# Animator class of each lips type
+ANIMATORS: dict[str, type[LIPSYNC2D_LipSyncAnimator]] = {
+    "SPRITESHEET": LIPSYNC_SpriteSheetAnimator,
+    "SHAPEKEYS": LIPSYNC2D_ShapeKeysAnimator,
+    "POSEASSETS": LIPSYNC2D_PoseAssetsAnimator,
+}
+
+# Loaded Vosk models, by language. Loading a model is the most expensive part of a bake.
+MODEL_CACHE: dict[str, Model] = {}
+
+
+@persistent
+def clear_model_cache(*_):
+    """Release loaded Vosk models, so that opening another file does not keep them in memory."""
+    MODEL_CACHE.clear()
+
 
 class LIPSYNC2D_OT_AnalyzeAudio(bpy.types.Operator):
     bl_idname = "sound.cgp_analyze_audio"
@@ -35,8 +60,9 @@ class LIPSYNC2D_OT_AnalyzeAudio(bpy.types.Operator):
         if context.active_object is None:
             return False
 
-        animator = LIPSYNC2D_OT_AnalyzeAudio.get_animator(context.active_object)
-        return animator.poll(cls, context)
+        # Polling only needs the animator class, no animator is created on redraws
+        animator_cls = ANIMATORS.get(context.active_object.lipsync2d_props.lip_sync_2d_lips_type)  # type: ignore
+        return animator_cls is not None and animator_cls.poll(cls, context)
 
     def execute(
         self, context: bpy.types.Context
@@ -61,29 +87,41 @@ class LIPSYNC2D_OT_AnalyzeAudio(bpy.types.Operator):
             self.report(type={"ERROR"}, message="No sound detected in Sequence Editor")
             return {"CANCELLED"}
 
-        self.set_bake_range()
-        file_path = extract_audio()
+        # Model loading runs in Vosk's native code, outside of the GIL, so it overlaps with the mixdown
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            model_future = self.submit_model_loading(executor, prefs.current_lang)
 
-        if not os.path.isfile(f"{file_path}"):
-            self.report(
-                type={"ERROR"},
-                message="Error while importing extracted audio WAV file from /tmp",
-            )
+            self.set_bake_range(obj.lipsync2d_props)  # type: ignore
+            file_path = extract_audio()
+
+            if not os.path.isfile(f"{file_path}"):
+                self.report(
+                    type={"ERROR"},
+                    message=f"Error while importing extracted audio WAV file {file_path}",
+                )
+                self.reset_bake_range()
+                return {"CANCELLED"}
+
+            model = model_future.result()
+
+        try:
+            framerate, data = self.read_audio(file_path)
+        except ValueError as error:
+            self.report(type={"ERROR"}, message=str(error))
             self.reset_bake_range()
             return {"CANCELLED"}
+        finally:
+            # Decoding only works on the in-memory audio, the file is not needed anymore
+            os.remove(file_path)
 
-        model = self.get_model(prefs)
-        result = self.vosk_recognize_voice(file_path, model)
+        result = self.vosk_recognize_voice(framerate, data, model)
 
         if "result" not in result:
             self.reset_bake_range()
-            os.remove(file_path)  # Need to be removed AFTER vosk_recognize_voice
             return {"FINISHED"}
 
         recognized_words = result["result"]
 
-        os.remove(file_path)  # Need to be removed AFTER vosk_recognize_voice
-
         dialog_inspector = LIPSYNC2D_DialogInspector(context.scene.render)
         words = [word["word"] for word in recognized_words]
         total_words = len(words)
@@ -95,6 +133,7 @@ class LIPSYNC2D_OT_AnalyzeAudio(bpy.types.Operator):
         self.auto_insert_keyframes(
             auto_obj, obj, recognized_words, dialog_inspector, total_words, phonemes
         )
+        auto_obj.flush_keyframes(obj)
         auto_obj.set_interpolation(obj)
         auto_obj.cleanup(obj)
         self.reset_bake_range()
@@ -118,30 +157,38 @@ class LIPSYNC2D_OT_AnalyzeAudio(bpy.types.Operator):
         phonemes,
     ):
         props = obj.lipsync2d_props  # type: ignore
-        words = enumerate(recognized_words)
-
-        for index, recognized_word in words:
-            is_last_word = index == total_words - 1
-            word_timing = dialog_inspector.get_word_timing(recognized_word)
-            visemes_data = dialog_inspector.get_visemes(
-                phonemes[index], word_timing["duration"]
+        get_visemes = dialog_inspector.get_visemes
+        get_corrected_end_frame = LIPSYNC2D_ShapeKeysAnimator.get_corrected_end_frame
+        insert_keyframes = auto_obj.insert_keyframes
+        phoneme_viseme_table = dialog_inspector.build_phoneme_viseme_table(phonemes)
+
+        # Each word timing is computed once, the next word's timing is then only a list lookup
+        word_timings = [
+            dialog_inspector.get_word_timing(recognized_word)
+            for recognized_word in recognized_words
+        ]
+        # Last word has no next word
+        next_word_timings: list[WordTiming | None] = [*word_timings[1:], None]
+
+        for index, (word_timing, word_phonemes, next_word_timing) in enumerate(
+            zip(word_timings, phonemes, next_word_timings)
+        ):
+            is_last_word = next_word_timing is None
+            visemes_data = get_visemes(
+                word_phonemes, word_timing["duration"], phoneme_viseme_table
             )
-            next_word_timing = dialog_inspector.get_next_word_timing(
-                recognized_words, index
+            next_word_frame_start = (
+                -1 if next_word_timing is None else next_word_timing["word_frame_start"]
             )
 
             # Last viseme is inserted a bit before end of word.
             # This ensures that delay_until_next_word uses correct timing
-            corrected_word_end_frame = (
-                LIPSYNC2D_ShapeKeysAnimator.get_corrected_end_frame(
-                    word_timing["word_frame_start"], visemes_data
-                )
-            )
-            delay_until_next_word = (
-                next_word_timing["word_frame_start"] - corrected_word_end_frame
+            corrected_word_end_frame = get_corrected_end_frame(
+                word_timing["word_frame_start"], visemes_data
             )
+            delay_until_next_word = next_word_frame_start - corrected_word_end_frame
 
-            auto_obj.insert_keyframes(
+            insert_keyframes(
                 obj,
                 props,
                 visemes_data,
@@ -153,23 +200,39 @@ class LIPSYNC2D_OT_AnalyzeAudio(bpy.types.Operator):
 
     @staticmethod
     def get_animator(obj: BpyObject) -> LIPSYNC2D_LipSyncAnimator:
-        props = obj.lipsync2d_props  # type: ignore
-        type = props.lip_sync_2d_lips_type
-
-        automations = {
-            "SPRITESHEET": LIPSYNC_SpriteSheetAnimator,
-            "SHAPEKEYS": LIPSYNC2D_ShapeKeysAnimator,
-            "POSEASSETS": LIPSYNC2D_PoseAssetsAnimator,
-        }
-
-        return automations[type]()
+        return ANIMATORS[obj.lipsync2d_props.lip_sync_2d_lips_type]()  # type: ignore
 
     @LIPSYNC2D_VoskHelper.setextensionpath
-    def get_model(self, prefs):
-        model = Model(lang=prefs.current_lang)
+    def submit_model_loading(self, executor: ThreadPoolExecutor, lang: str) -> Future[Model]:
+        """
+        Load the Vosk model of a language in the given executor. Vosk models directory is set,
+        and created if needed, on the calling thread before the loading is submitted.
+
+        :param executor: The executor running the model loading.
+        :param lang: The language code of the model.
+        :return: A future resolving to the loaded model.
+        :rtype: Future[Model]
+        """
+        return executor.submit(self.get_model, lang)
+
+    @staticmethod
+    def get_model(lang: str) -> Model:
+        model = MODEL_CACHE.get(lang)
+        if model is None:
+            model = Model(lang=lang)
+            MODEL_CACHE[lang] = model
         return model
 
-    def vosk_recognize_voice(self, file_path: str, model: Model):
+    @staticmethod
+    def read_audio(file_path: str) -> tuple[int, memoryview]:
+        """
+        Read the extracted audio in memory.
+
+        :param file_path: Path of the mono 16 bits PCM WAV file.
+        :raises ValueError: Raised when the file is not a mono 16 bits PCM WAV file.
+        :return: The sample rate of the audio and its raw PCM data.
+        :rtype: tuple[int, memoryview]
+        """
         with wave.open(file_path, "rb") as wf:
             # Check audio format
             if (
@@ -179,56 +242,117 @@ class LIPSYNC2D_OT_AnalyzeAudio(bpy.types.Operator):
             ):
                 raise ValueError("Audio file must be WAV format mono PCM.")
 
-            # Setup recognizer
-            rec = KaldiRecognizer(model, wf.getframerate())
-            rec.SetWords(True)
-
-            # Read and process audio
-            while True:
-                data = wf.readframes(4000)
-                if len(data) == 0:
-                    break
-                if rec.AcceptWaveform(data):
-                    pass
-            result = json.loads(rec.FinalResult())
-        return result
-
-    def set_bake_range(self) -> None:
-        if bpy.context.scene is None:
+            framerate = wf.getframerate()
+            # Whole payload is read at once, then only sliced through a memoryview, without copies
+            data = memoryview(wf.readframes(wf.getnframes()))
+
+        return framerate, data
+
+    def vosk_recognize_voice(self, framerate: int, data: memoryview, model: Model):
+        # Mono 16 bits PCM
+        bytes_per_second = framerate * 2
+        chunk_size = VOSK_CHUNK_SECONDS * bytes_per_second
+        overlap_size = VOSK_CHUNK_OVERLAP_SECONDS * bytes_per_second
+        chunk_starts = list(range(0, len(data), chunk_size))
+
+        # Vosk decodes on a single core. Long clips are split into overlapping chunks decoded in parallel,
+        # each one with its own recognizer sharing the same model. Short clips are decoded in one go.
+        if len(chunk_starts) <= 2:
+            words = self.recognize_chunk(model, framerate, data, 0.0)
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(chunk_starts), os.cpu_count() or 1)) as executor:
+                chunks_words = list(
+                    executor.map(
+                        lambda start: self.recognize_chunk(
+                            model,
+                            framerate,
+                            data[start : start + chunk_size + overlap_size],
+                            start / bytes_per_second,
+                        ),
+                        chunk_starts,
+                    )
+                )
+
+            words = merge_chunks_words(
+                chunks_words,
+                [start / bytes_per_second for start in chunk_starts],
+                VOSK_CHUNK_OVERLAP_SECONDS,
+            )
+
+        if not words:
+            return {"text": ""}
+
+        return {"result": words, "text": " ".join(word["word"] for word in words)}
+
+    @staticmethod
+    def recognize_chunk(
+        model: Model, framerate: int, data: memoryview, offset: float
+    ) -> list[dict]:
+        """
+        Decode a chunk of mono 16 bits PCM audio.
+
+        :param model: The Vosk model, can be shared between threads.
+        :param framerate: Sample rate of the audio.
+        :param data: Raw PCM data of the chunk.
+        :param offset: Time of the chunk in the whole audio, in seconds. Added to word timings.
+        :return: Recognized words, with timings relative to the whole audio.
+        :rtype: list[dict]
+        """
+        rec = KaldiRecognizer(model, framerate)
+        rec.SetWords(True)
+
+        words = []
+        step = VOSK_FEED_FRAMES * 2
+
+        for i in range(0, len(data), step):
+            # Recognizer resets itself after an utterance is complete, so its result is collected right away
+            if rec.AcceptWaveform(bytes(data[i : i + step])):
+                words.extend(json.loads(rec.Result()).get("result", []))
+
+        words.extend(json.loads(rec.FinalResult()).get("result", []))
+
+        if offset:
+            for word in words:
+                word["start"] += offset
+                word["end"] += offset
+
+        return words
+
+    def set_bake_range(self, props) -> None:
+        # Scene range to restore once baked, None when the scene range is left untouched
+        self._saved_range: tuple[int, int] | None = None
+        scene = bpy.context.scene
+
+        if scene is None or not props.lip_sync_2d_use_bake_range:
             return
 
-        props = bpy.context.active_object.lipsync2d_props  # type: ignore
         bake_start = props.lip_sync_2d_bake_start
         bake_end = props.lip_sync_2d_bake_end
-        use_bake_range = props.lip_sync_2d_use_bake_range
 
-        if not use_bake_range:
-            return
-
-        self.frame_start = LIPSYNC2D_Timeline.get_frame_start()
-        self.frame_end = LIPSYNC2D_Timeline.get_frame_end()
+        self._saved_range = (scene.frame_start, scene.frame_end)
 
-        bpy.context.scene.frame_start = max(0, bake_start)
+        scene.frame_start = max(0, bake_start)
         # Bake end should never be lower than bake start
-        bpy.context.scene.frame_end = max(bake_start, bake_end)
+        scene.frame_end = max(bake_start, bake_end)
 
     def reset_bake_range(self) -> None:
-        if bpy.context.scene is None:
-            return
-        props = bpy.context.active_object.lipsync2d_props  # type: ignore
-        use_bake_range = props.lip_sync_2d_use_bake_range
+        scene = bpy.context.scene
 
-        if not use_bake_range:
+        if scene is None or self._saved_range is None:
             return
 
-        bpy.context.scene.frame_start = self.frame_start
-        bpy.context.scene.frame_end = self.frame_end
+        scene.frame_start, scene.frame_end = self._saved_range
+        self._saved_range = None
 
 
 def extract_audio():
-    package_name = cast(str, get_package_name())
-    output_path = bpy.utils.extension_path_user(package_name, path="tmp", create=True)
-    filepath = os.path.join(output_path, "cgp_lipsync_extracted_audio.wav")
+    if os.path.isdir(SHARED_MEMORY_DIR) and os.access(SHARED_MEMORY_DIR, os.W_OK):
+        # Shared by every process of the machine, so the file name is made unique to this Blender instance
+        filepath = os.path.join(SHARED_MEMORY_DIR, f"cgp_lipsync_extracted_audio_{os.getpid()}.wav")
+    else:
+        package_name = cast(str, get_package_name())
+        output_path = bpy.utils.extension_path_user(package_name, path="tmp", create=True)
+        filepath = os.path.join(output_path, "cgp_lipsync_extracted_audio.wav")
 
     bpy.ops.sound.mixdown(
         filepath=filepath,
@@ -4,8 +4,8 @@ from typing import Literal, cast
 import bpy
 
 from ..Core.phoneme_to_viseme import (
+    VISEME_ITEMS,
     phonemes_to_default_sprite_index,
-    viseme_items_mpeg4_v2 as viseme_items,
 )
 
 from ..Core.LIPSYNC2D_SpritesheetNode import (
@@ -84,7 +84,7 @@ def create_custom_prop(obj: bpy.types.Object):
     obj.lipsync2d_props["lip_sync_2d_bake_start"] = 0  # type: ignore
     obj.lipsync2d_props["lip_sync_2d_bake_end"] = 0  # type: ignore
 
-    visemes = viseme_items(None, None)
+    visemes = VISEME_ITEMS
     mapping = phonemes_to_default_sprite_index()
 
     for v in visemes:
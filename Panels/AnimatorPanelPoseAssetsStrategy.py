@@ -2,7 +2,7 @@ import bpy
 
 from ..lipsync_types import BpyObject
 from .AnimatorPanelMixin import AnimatorPanelMixin
-from ..Core.phoneme_to_viseme import viseme_items_mpeg4_v2 as viseme_items
+from ..Core.phoneme_to_viseme import VISEME_ITEMS
 from ..lipsync_types import BpyContext, BpyUILayout
 
 
@@ -54,7 +54,7 @@ class AnimatorPanelPoseAssetsStrategy(AnimatorPanelMixin):
             row.label(text="Viseme")
             row.label(text="Pose")
 
-            visemes = viseme_items(None, None)
+            visemes = VISEME_ITEMS
 
             for i, viseme in enumerate(visemes):
                 lang_code = list(viseme)[0]
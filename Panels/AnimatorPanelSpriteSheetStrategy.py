@@ -1,5 +1,5 @@
 from .AnimatorPanelMixin import AnimatorPanelMixin
-from ..Core.phoneme_to_viseme import viseme_items_mpeg4_v2 as viseme_items
+from ..Core.phoneme_to_viseme import VISEME_ITEMS
 from ..lipsync_types import BpyContext, BpyUILayout
 
 
@@ -81,7 +81,7 @@ class AnimatorPanelSpriteSheetStrategy(AnimatorPanelMixin):
             row.label(text="Viseme")
             row.label(text="Image index")
 
-            visemes = viseme_items(None, None)
+            visemes = VISEME_ITEMS
 
             for i, viseme in enumerate(visemes):
                 lang_code = list(viseme)[0]
@@ -1,6 +1,4 @@
-import os
 from pathlib import Path
-from re import match
 from typing import Literal
 
 import bpy
@@ -31,7 +29,6 @@ class LIPSYNC2D_AP_Preferences(bpy.types.AddonPreferences):
         LIPSYNC2D_AP_Preferences.draw_fetch_list_ops(layout)
 
     @staticmethod
-    @LIPSYNC2D_VoskHelper.setextensionpath
     def draw_model_state(row: bpy.types.UILayout) -> None:
         """
         Updates the UI to display the current status of the selected language model.
@@ -68,13 +65,15 @@ class LIPSYNC2D_AP_Preferences(bpy.types.AddonPreferences):
         if prefs is None:
             return result
         
-        current_lang = LIPSYNC2D_AP_Preferences.get_current_lang_code()
+        current_lang = prefs.current_lang # type: ignore
 
         if current_lang != "none":
             if directory is not None and Path(directory).exists():
-                model_file_list = os.listdir(directory)
-                model_file = [model for model in model_file_list if match(f"vosk-model(-small)?-{current_lang}", model) and os.path.isdir(os.path.join(directory, model))]
-                if model_file:
+                # Directory listing is cached by get_model_dir_names until the directory changes
+                model_prefixes = (f"vosk-model-{current_lang}", f"vosk-model-small-{current_lang}")
+                model_dir_names = LIPSYNC2D_VoskHelper.get_model_dir_names(Path(directory))
+
+                if any(model.startswith(model_prefixes) for model in model_dir_names):
                     result = "INSTALLED"
                 elif prefs.is_downloading: #type: ignore
                     result = "DOWNLOADING"
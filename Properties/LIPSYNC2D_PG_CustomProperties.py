@@ -1,51 +1,67 @@
 from __future__ import annotations
-from typing import cast
 
 import bpy
+from bpy.app.handlers import persistent
 
 from ..Utils.strings import intern_enum_items
 
 from ..lipsync_types import BpyContext
 
-from ..Core.phoneme_to_viseme import viseme_items_mpeg4_v2 as viseme_items
+from ..Core.phoneme_to_viseme import VISEME_ITEMS
 
+# Shape keys enum items, by (shape keys pointer, shape keys count). Every viseme shape key
+# EnumProperty calls shape_keys_list on each redraw, so items are only rebuilt after a depsgraph update
+SHAPE_KEYS_ITEMS_CACHE: dict[tuple[int, int], list[tuple[str, str, str]]] = {}
 
+
+@persistent
+def clear_shape_keys_items_cache(*_):
+    """Drop cached shape keys enum items, as shape keys may have been renamed, added or removed."""
+    SHAPE_KEYS_ITEMS_CACHE.clear()
+
+
+# Rig types behave like radio buttons: enabling one disables the other, disabling one re-enables it.
+# Only values that actually change are written.
 def update_rig_type_advanced(self, context):
-    if self.lip_sync_2d_rig_type_advanced:
+    if not self.lip_sync_2d_rig_type_advanced:
+        self["lip_sync_2d_rig_type_advanced"] = True
+    elif self.get("lip_sync_2d_rig_type_basic", True):
         self["lip_sync_2d_rig_type_basic"] = False
-    self["lip_sync_2d_rig_type_advanced"] = True
 
 
 def update_rig_type_basic(self, context):
-    if self.lip_sync_2d_rig_type_basic:
+    if not self.lip_sync_2d_rig_type_basic:
+        self["lip_sync_2d_rig_type_basic"] = True
+    elif self.get("lip_sync_2d_rig_type_advanced"):
         self["lip_sync_2d_rig_type_advanced"] = False
-    self["lip_sync_2d_rig_type_basic"] = True
 
 
 def update_sprite_sheet(self: bpy.types.bpy_struct, context: bpy.types.Context):
     obj = context.active_object
     mat: bpy.types.Material = obj.lipsync2d_props.lip_sync_2d_main_material  # type: ignore
 
-    if mat is None or mat.node_tree is None or mat.node_tree.nodes is None:
+    # Every node tree and nodes collection is read once, each RNA attribute access has a cost.
+    # A missing material or node tree resolves to no nodes.
+    mat_nodes = getattr(getattr(mat, "node_tree", None), "nodes", None)
+
+    if mat_nodes is None:
         return
 
-    main_group = cast(
-        bpy.types.ShaderNodeGroup, mat.node_tree.nodes.get("cgp_main_group")
-    )
+    main_group = mat_nodes.get("cgp_main_group")
 
-    if main_group is None or main_group.node_tree is None:
+    if not isinstance(main_group, bpy.types.ShaderNodeGroup) or (main_tree := main_group.node_tree) is None:
         return
 
-    group_node = main_group.node_tree.nodes.get("cgp_spritesheet_reader")
+    group_node = main_tree.nodes.get("cgp_spritesheet_reader")
 
     if (
         not isinstance(group_node, bpy.types.ShaderNodeGroup)
-        or group_node.node_tree is None
-        or group_node.node_tree.nodes is None
+        or (group_tree := group_node.node_tree) is None
+        or (group_nodes := group_tree.nodes) is None
     ):
         return
 
-    image_node = group_node.node_tree.nodes.get("CGP_LipSyncSpritesheet")
+    image_node = group_nodes.get("CGP_LipSyncSpritesheet")
 
     if not isinstance(image_node, bpy.types.ShaderNodeTexImage):
         return
@@ -55,15 +71,46 @@ def update_sprite_sheet(self: bpy.types.bpy_struct, context: bpy.types.Context):
     return None
 
 
+def format_square_sprite_sheet(self: bpy.types.bpy_struct):
+    self["lip_sync_2d_sprite_sheet_rows"] = self["lip_sync_2d_sprite_sheet_columns"]
+
+
+def format_hline_sprite_sheet(self: bpy.types.bpy_struct):
+    self["lip_sync_2d_sprite_sheet_rows"] = 1
+
+
+def format_vline_sprite_sheet(self: bpy.types.bpy_struct):
+    self["lip_sync_2d_sprite_sheet_columns"] = 1
+
+
+SPRITE_SHEET_FORMAT_ITEMS = (
+    (
+        "SQUARE",
+        "Square",
+        "Sprites are placed in a square with same width and height",
+    ),
+    (
+        "RECTANGLE",
+        "Rectangle",
+        "Sprites are placed in a rectangle with multiple columns and rows",
+    ),
+    ("HLINE", "Horizontal Line", "Sprites are placed horizontally"),
+    ("VLINE", "Vertical Line", "Sprites are placed vertically"),
+)
+
+# Rows and columns adjustment of each sprite sheet format. Rectangle keeps both as they are
+SPRITE_SHEET_FORMAT_HANDLERS = {
+    0: format_square_sprite_sheet,
+    2: format_hline_sprite_sheet,
+    3: format_vline_sprite_sheet,
+}
+
+
 def update_sprite_sheet_format(self: bpy.types.bpy_struct, context: bpy.types.Context):
-    spritesheet_format = self["lip_sync_2d_sprite_sheet_format"]
+    handler = SPRITE_SHEET_FORMAT_HANDLERS.get(self["lip_sync_2d_sprite_sheet_format"])
 
-    if spritesheet_format == 0:
-        self["lip_sync_2d_sprite_sheet_rows"] = self["lip_sync_2d_sprite_sheet_columns"]
-    elif spritesheet_format == 2:
-        self["lip_sync_2d_sprite_sheet_rows"] = 1
-    elif spritesheet_format == 3:
-        self["lip_sync_2d_sprite_sheet_columns"] = 1
+    if handler is not None:
+        handler(self)
 
 
 def update_sprite_sheet_rows(self: bpy.types.bpy_struct, context: bpy.types.Context):
@@ -76,11 +123,13 @@ def update_sprite_sheet_rows(self: bpy.types.bpy_struct, context: bpy.types.Cont
         self["lip_sync_2d_sprite_sheet_columns"] = self["lip_sync_2d_sprite_sheet_rows"]
 
 
-def shape_keys_list(self: bpy.types.bpy_struct, context: bpy.types.Context | None):
-    result = [("NONE", "None", "None")]
+# Item listed first by every shape keys enum, and the only one when there are no shape keys
+NONE_SHAPE_KEY_ITEMS = intern_enum_items([("NONE", "None", "None")])
 
+
+def shape_keys_list(self: bpy.types.bpy_struct, context: bpy.types.Context | None):
     if context is None or context.active_object is None:
-        return result
+        return NONE_SHAPE_KEY_ITEMS
 
     active_obj = context.active_object
 
@@ -88,19 +137,28 @@ def shape_keys_list(self: bpy.types.bpy_struct, context: bpy.types.Context | Non
         not isinstance(active_obj.data, bpy.types.Mesh)
         or active_obj.data.shape_keys is None
     ):
-        return result
+        return NONE_SHAPE_KEY_ITEMS
 
     shape_keys = active_obj.data.shape_keys
     key_blocks = active_obj.data.shape_keys.key_blocks
+    cache_key = (shape_keys.as_pointer(), len(key_blocks))
+    items = SHAPE_KEYS_ITEMS_CACHE.get(cache_key)
 
-    result = result + [
-        (s.name, s.name, s.name) for s in key_blocks if s != shape_keys.reference_key
-    ]
+    if items is None:
+        # Reference key is always the first key block
+        items = NONE_SHAPE_KEY_ITEMS + intern_enum_items(
+            [(s.name, s.name, s.name) for s in key_blocks[1:]]
+        )
+        SHAPE_KEYS_ITEMS_CACHE[cache_key] = items
 
-    return intern_enum_items(result)
+    return items
 
 
 def set_bake_end(self, value):
+    # Dragging the field calls the setter with the same value many times, skip those writes
+    if self.get("lip_sync_2d_bake_end") == value:
+        return
+
     if value < self.lip_sync_2d_bake_start:
         self["lip_sync_2d_bake_start"] = value
 
@@ -108,13 +166,13 @@ def set_bake_end(self, value):
 
 
 def get_bake_end(self):
-    try:
-        return self["lip_sync_2d_bake_end"]
-    except:
-        return 0
+    return self.get("lip_sync_2d_bake_end", 0)
 
 
 def set_bake_start(self, value):
+    if self.get("lip_sync_2d_bake_start") == value:
+        return
+
     if value > self.lip_sync_2d_bake_end:
         self["lip_sync_2d_bake_end"] = value
 
@@ -122,21 +180,16 @@ def set_bake_start(self, value):
 
 
 def get_bake_start(self):
-    try:
-        return self["lip_sync_2d_bake_start"]
-    except:
-        return 0
+    return self.get("lip_sync_2d_bake_start", 0)
 
 
 def armature_prop_poll(self, obj):
     return obj.type == "ARMATURE"
 
 
-def get_lip_sync_type_items(self, context: BpyContext | None):
-    if context is None or context.active_object is None:
-        return []
-
-    items = [
+# Lips type items never change, they are built once and the same lists are returned on every redraw
+LIP_SYNC_TYPE_ITEMS = intern_enum_items(
+    [
         (
             "SPRITESHEET",
             "Sprite Sheet",
@@ -144,19 +197,60 @@ def get_lip_sync_type_items(self, context: BpyContext | None):
         ),
         ("SHAPEKEYS", "Shape Keys", "Use your Shape Keys to animate mouth"),
     ]
+)
+ARMATURE_LIP_SYNC_TYPE_ITEMS = intern_enum_items(
+    [
+        ("POSEASSETS", "Pose Assets", "Use Pose Library to animate mouth"),
+    ]
+)
+
+
+def get_lip_sync_type_items(self, context: BpyContext | None):
+    if context is None or context.active_object is None:
+        return []
 
     if context.active_object.type == "ARMATURE":
-        items = [
-            ("POSEASSETS", "Pose Assets", "Use Pose Library to animate mouth"),
-        ]
+        return ARMATURE_LIP_SYNC_TYPE_ITEMS
 
-    return items
+    return LIP_SYNC_TYPE_ITEMS
 
 
 def poll_pose_assets(self, obj: bpy.types.ID):
     return bool(obj.asset_data)
 
 
+def add_viseme_properties(cls):
+    """
+    Declare the sprite index, shape key and pose properties of every viseme as annotations,
+    so Blender creates them in the same register_class pass as the other properties.
+
+    :param cls: The property group class receiving the viseme properties.
+    :return: The same class, with viseme properties added to its annotations.
+    """
+    annotations = {}
+
+    for enum_id, name, desc in VISEME_ITEMS:
+        annotations[f"lip_sync_2d_viseme_{enum_id}"] = bpy.props.IntProperty(
+            name=f"Viseme {name}", description=desc, min=0, max=99, default=-1
+        )
+        annotations[f"lip_sync_2d_viseme_shape_keys_{enum_id}"] = bpy.props.EnumProperty(
+            name=f"Viseme {name}",
+            description=desc,
+            items=shape_keys_list,
+            default=0,
+        )
+        annotations[f"lip_sync_2d_viseme_pose_{enum_id}"] = bpy.props.PointerProperty(
+            type=bpy.types.Action,
+            name=f"Viseme {name}",
+            description=desc,
+            poll=poll_pose_assets,
+        )
+
+    cls.__annotations__ = {**cls.__dict__.get("__annotations__", {}), **annotations}
+    return cls
+
+
+@add_viseme_properties
 class LIPSYNC2D_PG_CustomProperties(bpy.types.PropertyGroup):
     lip_sync_2d_initialized: bpy.props.BoolProperty(
         name="Initilize Lip Sync",
@@ -199,20 +293,7 @@ class LIPSYNC2D_PG_CustomProperties(bpy.types.PropertyGroup):
     lip_sync_2d_sprite_sheet_format: bpy.props.EnumProperty(
         name="Sprite sheet format",
         description="Sprite sheet format can be square, rectangle or line.",
-        items=[
-            (
-                "SQUARE",
-                "Square",
-                "Sprites are placed in a square with same width and height",
-            ),
-            (
-                "RECTANGLE",
-                "Rectangle",
-                "Sprites are placed in a rectangle with multiple columns and rows",
-            ),
-            ("HLINE", "Horizontal Line", "Sprites are placed horizontally"),
-            ("VLINE", "Vertical Line", "Sprites are placed vertically"),
-        ],
+        items=SPRITE_SHEET_FORMAT_ITEMS,
         update=update_sprite_sheet_format,
         default=3,
     )  # type: ignore
@@ -336,42 +417,3 @@ class LIPSYNC2D_PG_CustomProperties(bpy.types.PropertyGroup):
         ),
         default=False,
     )  # type: ignore
-
-    @classmethod
-    def register(cls):
-        visemes = viseme_items(None, None)
-
-        for v in visemes:
-            enum_id, name, desc = v
-            prop_name = f"lip_sync_2d_viseme_{enum_id}"
-            setattr(
-                cls,
-                prop_name,
-                bpy.props.IntProperty(
-                    name=f"Viseme {name}", description=desc, min=0, max=99, default=-1
-                ),  # type: ignore
-            )
-
-            prop_name = f"lip_sync_2d_viseme_shape_keys_{enum_id}"
-            setattr(
-                cls,
-                prop_name,
-                bpy.props.EnumProperty(
-                    name=f"Viseme {name}",
-                    description=desc,
-                    items=shape_keys_list,
-                    default=0,
-                ),  # type: ignore
-            )
-
-            prop_name = f"lip_sync_2d_viseme_pose_{enum_id}"
-            setattr(
-                cls,
-                prop_name,
-                bpy.props.PointerProperty(
-                    type=bpy.types.Action,
-                    name=f"Viseme {name}",
-                    description=desc,
-                    poll=poll_pose_assets,
-                ),
-            )
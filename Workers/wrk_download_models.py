@@ -1,14 +1,78 @@
 import pathlib
 import sys
+import zipfile
 
-from vosk import MODEL_DIRS, Model
+import requests
+from vosk import MODEL_DIRS, MODEL_LIST_URL, MODEL_PRE_URL
+
+# Size of the blocks written to disk while a model archive is downloaded
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def find_installed_model(lang: str) -> pathlib.Path | None:
+    """
+    Look for an already installed model of the given language in Vosk model directories,
+    the same way Vosk does before downloading one.
+
+    :param lang: The language code of the model.
+    :return: Path of the installed model, or None if there is none.
+    """
+    model_prefixes = (f"vosk-model-{lang}", f"vosk-model-small-{lang}")
+
+    for directory in MODEL_DIRS:
+        if directory is None or not pathlib.Path(directory).exists():
+            continue
+
+        for model in pathlib.Path(directory).iterdir():
+            if model.name.startswith(model_prefixes) and model.is_dir():
+                return model
+
+    return None
+
+
+def get_model_name(lang: str) -> str | None:
+    """
+    Get the name of the small, non obsolete model Vosk uses for the given language.
+
+    :param lang: The language code of the model.
+    :return: Name of the model, or None if no model exists for this language.
+    """
+    models = requests.get(MODEL_LIST_URL, timeout=10).json()
+    model_names = [model["name"] for model in models if model["lang"] == lang and model["type"] == "small" and model["obsolete"] == "false"]
+
+    return model_names[0] if model_names else None
+
+
+def download_model(model_name: str, model_path: pathlib.Path) -> None:
+    """
+    Download a model archive in large blocks straight to disk, then extract it next to the archive.
+
+    :param model_name: Name of the model to download.
+    :param model_path: The directory where the model is extracted.
+    :return: None
+    """
+    archive_path = model_path / f"{model_name}.zip"
+
+    with requests.get(f"{MODEL_PRE_URL}{model_name}.zip", stream=True, timeout=10) as response:
+        response.raise_for_status()
+        with archive_path.open("wb") as archive:
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                archive.write(chunk)
+
+    with zipfile.ZipFile(archive_path) as model_archive:
+        model_archive.extractall(model_path)
+
+    archive_path.unlink()
 
 
 def install_model(lang: str, vosk_cache: str) -> None:
     """
     Download and/or Installs the specified language model for speech recognition. This function ensures
-    the target directory for the model exists and initializes the model using the
-    provided language and cache directory.
+    the target directory for the model exists, then downloads and extracts the model of the given
+    language unless one is already installed.
+
+    The model is not loaded: the worker only has to put its files in the cache directory, Blender
+    loads it when audio is analyzed.
 
     :param lang: The language code for the model to be installed.
     :param vosk_cache: The directory path where the model should be cached.
@@ -20,11 +84,17 @@ def install_model(lang: str, vosk_cache: str) -> None:
     if not model_path.exists():
         model_path.mkdir(parents=True, exist_ok=True)
 
-    Model(lang=lang)
+    if find_installed_model(lang) is not None:
+        return
+
+    model_name = get_model_name(lang)
+
+    if model_name is None:
+        sys.exit(1)
 
+    download_model(model_name, model_path)
 
-args = sys.argv[1:]
-lang = args[0]
-vosk_cache = args[1]
 
-install_model(args[0], args[1])
\ No newline at end of file
+if __name__ == "__main__":
+    _, lang, vosk_cache = sys.argv
+    install_model(lang, vosk_cache)
\ No newline at end of file
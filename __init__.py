@@ -5,7 +5,7 @@ from .Operators.LIPSYNC2D_OT_refresh_pose_assets import LIPSYNC2D_OT_refresh_pos
 
 from .Core.LIPSYNC2D_EspeakInspector import LIPSYNC2D_EspeakInspector
 from .Core.LIPSYNC2D_VoskHelper import LIPSYNC2D_VoskHelper
-from .Operators.LIPSYNC2D_OT_AnalyzeAudio import LIPSYNC2D_OT_AnalyzeAudio
+from .Operators.LIPSYNC2D_OT_AnalyzeAudio import LIPSYNC2D_OT_AnalyzeAudio, clear_model_cache
 from .Operators.LIPSYNC2D_OT_DownloadModelsList import LIPSYNC2D_OT_DownloadModelsList
 from .Operators.LIPSYNC2D_OT_RemoveAnimations import LIPSYNC2D_OT_RemoveAnimations
 from .Operators.LIPSYNC2D_OT_RemoveLipSync import LIPSYNC2D_OT_RemoveLipSync
@@ -16,7 +16,34 @@ from .Panels.LIPSYNC2D_PT_Panel import LIPSYNC2D_PT_Panel
 from .Panels.LIPSYNC2D_PT_Settings import LIPSYNC2D_PT_Settings
 from .Panels.LIPSYNC2D_PT_Edit import LIPSYNC2D_PT_Edit
 from .Preferences.LIPSYNC2D_AP_Preferences import LIPSYNC2D_AP_Preferences
-from .Properties.LIPSYNC2D_PG_CustomProperties import LIPSYNC2D_PG_CustomProperties
+from .Properties.LIPSYNC2D_PG_CustomProperties import LIPSYNC2D_PG_CustomProperties, clear_shape_keys_items_cache
+
+
+classes = (
+    LIPSYNC2D_AP_Preferences,
+    LIPSYNC2D_PG_CustomProperties,
+    LIPSYNC2D_PT_Settings,
+    LIPSYNC2D_PT_Panel,
+    LIPSYNC2D_OT_SetMouthArea,
+    LIPSYNC2D_OT_SetCustomProperties,
+    LIPSYNC2D_OT_AnalyzeAudio,
+    LIPSYNC2D_OT_DownloadModelsList,
+    LIPSYNC2D_OT_RemoveLipSync,
+    LIPSYNC2D_OT_RemoveNodeGroups,
+    LIPSYNC2D_PT_Edit,
+    LIPSYNC2D_OT_RemoveAnimations,
+    LIPSYNC2D_OT_refresh_pose_assets,
+)
+
+# Classes are unregistered in reverse order of registration
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+lipsync2d_props = bpy.props.PointerProperty(type=LIPSYNC2D_PG_CustomProperties)
+
+
+def cache_online_langs_list() -> None:
+    """Fetch the online models list once Blender is running, so enabling the add-on does not wait for the network."""
+    LIPSYNC2D_VoskHelper.cache_online_langs_list()
+    return None
 
 
 def register():
@@ -24,38 +51,27 @@ def register():
         LIPSYNC2D_EspeakInspector.unzip_binaries()
     LIPSYNC2D_EspeakInspector.set_espeak_backend()
     if bpy.app.online_access:
-        LIPSYNC2D_VoskHelper.cache_online_langs_list()
-    bpy.utils.register_class(LIPSYNC2D_AP_Preferences)
-    bpy.utils.register_class(LIPSYNC2D_PG_CustomProperties)
-    bpy.utils.register_class(LIPSYNC2D_PT_Settings)
-    bpy.utils.register_class(LIPSYNC2D_PT_Panel)
-    bpy.utils.register_class(LIPSYNC2D_OT_SetMouthArea)
-    bpy.utils.register_class(LIPSYNC2D_OT_SetCustomProperties)
-    bpy.utils.register_class(LIPSYNC2D_OT_AnalyzeAudio)
-    bpy.utils.register_class(LIPSYNC2D_OT_DownloadModelsList)
-    bpy.utils.register_class(LIPSYNC2D_OT_RemoveLipSync)
-    bpy.utils.register_class(LIPSYNC2D_OT_RemoveNodeGroups)
-    bpy.utils.register_class(LIPSYNC2D_PT_Edit)
-    bpy.utils.register_class(LIPSYNC2D_OT_RemoveAnimations)
-    bpy.utils.register_class(LIPSYNC2D_OT_refresh_pose_assets)
-    bpy.types.Object.lipsync2d_props = bpy.props.PointerProperty(type=LIPSYNC2D_PG_CustomProperties)  # type: ignore
+        bpy.app.timers.register(cache_online_langs_list, first_interval=0.1, persistent=True)
+    register_classes()
+    bpy.types.Object.lipsync2d_props = lipsync2d_props  # type: ignore
+    bpy.app.handlers.load_pre.append(clear_model_cache)
+    bpy.app.handlers.load_pre.append(clear_shape_keys_items_cache)
+    bpy.app.handlers.depsgraph_update_post.append(clear_shape_keys_items_cache)
 
 
 def unregister():
-    bpy.utils.unregister_class(LIPSYNC2D_PG_CustomProperties)
-    bpy.utils.unregister_class(LIPSYNC2D_PT_Panel)
-    bpy.utils.unregister_class(LIPSYNC2D_OT_SetMouthArea)
-    bpy.utils.unregister_class(LIPSYNC2D_OT_SetCustomProperties)
-    bpy.utils.unregister_class(LIPSYNC2D_OT_AnalyzeAudio)
-    bpy.utils.unregister_class(LIPSYNC2D_AP_Preferences)
-    bpy.utils.unregister_class(LIPSYNC2D_PT_Settings)
-    bpy.utils.unregister_class(LIPSYNC2D_OT_DownloadModelsList)
-    bpy.utils.unregister_class(LIPSYNC2D_OT_RemoveLipSync)
-    bpy.utils.unregister_class(LIPSYNC2D_OT_RemoveNodeGroups)
-    bpy.utils.unregister_class(LIPSYNC2D_PT_Edit)
-    bpy.utils.unregister_class(LIPSYNC2D_OT_RemoveAnimations)
-    bpy.utils.unregister_class(LIPSYNC2D_OT_refresh_pose_assets)
+    if bpy.app.timers.is_registered(cache_online_langs_list):
+        bpy.app.timers.unregister(cache_online_langs_list)
+    unregister_classes()
     del bpy.types.Object.lipsync2d_props  # type: ignore
+    if clear_model_cache in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(clear_model_cache)
+    clear_model_cache()
+    if clear_shape_keys_items_cache in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(clear_shape_keys_items_cache)
+    if clear_shape_keys_items_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(clear_shape_keys_items_cache)
+    clear_shape_keys_items_cache()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+import importlib.util
+import pathlib
+import unittest
+
+# The add-on package imports bpy, the module is loaded on its own
+_MODULE_PATH = pathlib.Path(__file__).parents[1] / "Core" / "audio_chunks.py"
+_spec = importlib.util.spec_from_file_location("audio_chunks", _MODULE_PATH)
+audio_chunks = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(audio_chunks)
+
+
+def word(text, start, end):
+    return {"word": text, "start": start, "end": end, "conf": 1.0}
+
+
+class MergeChunksWordsTest(unittest.TestCase):
+    # Chunks of 30 seconds overlapping by 5 seconds: [0, 35] and [30, inf]
+    CHUNK_STARTS = [0.0, 30.0]
+    OVERLAP = 5.0
+
+    def merge(self, *chunks_words):
+        return audio_chunks.merge_chunks_words(
+            list(chunks_words), self.CHUNK_STARTS, self.OVERLAP
+        )
+
+    def test_word_straddling_chunk_end_is_taken_from_later_chunk(self):
+        # "boundary" spans 34.6 to 35.4, the earlier chunk only decoded its beginning
+        earlier = [word("before", 28.0, 28.5), word("bound", 34.6, 35.0)]
+        later = [word("before", 28.0, 28.5), word("boundary", 34.6, 35.4), word("after", 36.0, 36.4)]
+
+        words = self.merge(earlier, later)
+
+        self.assertEqual([w["word"] for w in words], ["before", "boundary", "after"])
+
+    def test_word_decoded_by_both_chunks_is_kept_once(self):
+        # "twice" lies inside the overlap, both chunks decoded it with slightly different timings
+        earlier = [word("first", 29.0, 29.5), word("twice", 31.0, 31.5)]
+        later = [word("twice", 30.98, 31.52), word("then", 31.5, 32.0)]
+
+        words = self.merge(earlier, later)
+
+        self.assertEqual([w["word"] for w in words], ["first", "twice", "then"])
+        self.assertEqual(words[1]["start"], 31.0)
+
+    def test_truncated_word_at_later_chunk_start_is_taken_from_earlier_chunk(self):
+        # The later chunk starts in the middle of "cut"
+        earlier = [word("cut", 29.8, 30.3), word("next", 30.5, 31.0)]
+        later = [word("ut", 30.0, 30.3), word("next", 30.5, 31.0)]
+
+        words = self.merge(earlier, later)
+
+        self.assertEqual([w["word"] for w in words], ["cut", "next"])
+
+
+if __name__ == "__main__":
+    unittest.main()